@@ -7,6 +7,8 @@ Usage:
     python -m daem0nmcp.cli [--json] [--project-path PATH] <command>
 
     python -m daem0nmcp.cli check <filepath>
+    python -m daem0nmcp.cli check-triggers <filepath>
+    python -m daem0nmcp.cli check-all <filepath>
     python -m daem0nmcp.cli briefing
     python -m daem0nmcp.cli scan-todos [--auto-remember] [--path PATH]
     python -m daem0nmcp.cli migrate [--backfill-vectors]
@@ -51,7 +53,13 @@ def safe_print(text: str, file=None) -> None:
         print(safe_text, file=output)
 
 
-async def check_file(filepath: str, db: DatabaseManager, memory: MemoryManager, rules: RulesEngine) -> dict:
+async def check_file(
+    filepath: str,
+    db: DatabaseManager,
+    memory: MemoryManager,
+    rules: RulesEngine,
+    project_path: str | None = None
+) -> dict:
     """Check a file against memories and rules."""
     await db.init_db()
 
@@ -64,7 +72,7 @@ async def check_file(filepath: str, db: DatabaseManager, memory: MemoryManager,
     }
 
     # Get file-specific memories
-    file_memories = await memory.recall_for_file(filepath, project_path=settings.project_root)
+    file_memories = await memory.recall_for_file(filepath, project_path=project_path or settings.project_root)
 
     # Check for warnings in file memories
     for cat in ['warnings', 'decisions', 'patterns', 'learnings']:
@@ -100,6 +108,36 @@ async def check_file(filepath: str, db: DatabaseManager, memory: MemoryManager,
     return results
 
 
+async def check_triggers(
+    filepath: str,
+    db: DatabaseManager,
+    project_path: str | None = None
+) -> dict:
+    """Check context triggers for a file and auto-recall matching memories."""
+    from .context_triggers import ContextTriggerManager
+
+    await db.init_db()
+    tm = ContextTriggerManager(db)
+    return await tm.get_triggered_context(
+        project_path=project_path or settings.project_root,
+        file_path=filepath
+    )
+
+
+async def check_all(
+    filepath: str,
+    db: DatabaseManager,
+    memory: MemoryManager,
+    rules: RulesEngine,
+    project_path: str | None = None
+) -> dict:
+    """Run check and check-triggers together (one process for the pre-edit hook)."""
+    return {
+        "memories": await check_file(filepath, db, memory, rules, project_path=project_path),
+        "triggers": await check_triggers(filepath, db, project_path=project_path),
+    }
+
+
 async def get_briefing(db: DatabaseManager, memory: MemoryManager) -> dict:
     """Get session briefing."""
     await db.init_db()
@@ -268,6 +306,14 @@ def main():
     check_parser = subparsers.add_parser("check", help="Check a file against memory")
     check_parser.add_argument("filepath", help="File to check")
 
+    # check-triggers command
+    triggers_parser = subparsers.add_parser("check-triggers", help="Check context triggers for a file")
+    triggers_parser.add_argument("filepath", help="File to check")
+
+    # check-all command (check + check-triggers in one process, for hooks)
+    check_all_parser = subparsers.add_parser("check-all", help="Run check and check-triggers for a file")
+    check_all_parser.add_argument("filepath", help="File to check")
+
     # briefing command
     subparsers.add_parser("briefing", help="Get session briefing")
 
@@ -357,6 +403,23 @@ def main():
         else:
             print(format_check_result(result))
 
+    elif args.command == "check-triggers":
+        result = asyncio.run(check_triggers(args.filepath, db))
+        if args.json:
+            print(json.dumps(result, default=str))
+        else:
+            for trigger in result.get("triggers", []):
+                safe_print(f"{trigger.get('pattern')} -> recall '{trigger.get('recall_topic')}'")
+            print(f"Total triggers: {result.get('total_triggers', 0)}")
+
+    elif args.command == "check-all":
+        result = asyncio.run(check_all(args.filepath, db, memory, rules))
+        if args.json:
+            print(json.dumps(result, default=str))
+        else:
+            print(format_check_result(result["memories"]))
+            print(f"Triggers matched: {result['triggers'].get('total_triggers', 0)}")
+
     elif args.command == "briefing":
         result = asyncio.run(get_briefing(db, memory))
         if args.json:
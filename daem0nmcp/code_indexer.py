@@ -16,8 +16,28 @@ from datetime import datetime, timezone
 
 from .config import settings
 
+try:
+    # BLAKE3 hashes with SIMD and several threads; hashlib is the fallback
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
 logger = logging.getLogger(__name__)
 
+
+def content_digest(data: bytes) -> str:
+    """
+    Hex digest used to detect file content changes.
+
+    BLAKE3 when installed, SHA-256 otherwise. Both are 64 hex characters, so
+    they fit FileHash.content_hash; switching backends just makes each file
+    look changed once and get re-indexed.
+    """
+    if _blake3 is not None:
+        return _blake3(data, max_threads=_blake3.AUTO).hexdigest()
+    return hashlib.sha256(data).hexdigest()
+
+
 # Language configuration: file extension -> tree-sitter language name
 LANGUAGE_CONFIG = {
     ".py": "python",
@@ -186,6 +206,12 @@ def is_available() -> bool:
     return _check_tree_sitter_available()
 
 
+# Loaded grammars shared by every indexer in the process, so each is loaded
+# once rather than once per TreeSitterIndexer. Languages are immutable; the
+# stateful Parser built from one stays per indexer
+_LANGUAGE_CACHE: Dict[str, Any] = {}
+
+
 class TreeSitterIndexer:
     """
     Universal code indexer using tree-sitter.
@@ -216,10 +242,15 @@ class TreeSitterIndexer:
 
         if lang not in self._parsers:
             try:
-                from tree_sitter_language_pack import get_parser, get_language
+                import tree_sitter
+
+                language = _LANGUAGE_CACHE.get(lang)
+                if language is None:
+                    from tree_sitter_language_pack import get_language
 
-                self._parsers[lang] = get_parser(lang)
-                self._languages[lang] = get_language(lang)
+                    language = _LANGUAGE_CACHE[lang] = get_language(lang)
+                self._parsers[lang] = tree_sitter.Parser(language)
+                self._languages[lang] = language
             except Exception as e:
                 logger.warning(f"Failed to get parser for {lang}: {e}")
                 return None, None
@@ -228,7 +259,7 @@ class TreeSitterIndexer:
 
     def _get_cached_tree(self, file_path: Path, source: bytes, lang: str):
         """Get parse tree from cache or parse and cache."""
-        content_hash = hashlib.md5(source).hexdigest()
+        content_hash = content_digest(source)
         cache_key = str(file_path)
 
         # Check cache
@@ -1195,7 +1226,7 @@ class CodeIndexManager:
 
         # Compute current hash
         try:
-            current_hash = hashlib.sha256(file_path.read_bytes()).hexdigest()
+            current_hash = content_digest(file_path.read_bytes())
         except (OSError, IOError) as e:
             return {"changed": False, "error": str(e)}
 
@@ -8,7 +8,7 @@ and generates summaries for each community.
 import logging
 from typing import Dict, List, Any, Optional, Set
 from datetime import datetime, timezone
-from collections import defaultdict
+from collections import Counter, defaultdict
 from sqlalchemy import select, delete
 
 from .database import DatabaseManager
@@ -143,10 +143,26 @@ class CommunityManager:
 
         # Union memories that share enough tags
         memory_ids = list(memory_tags.keys())
-        for i, mid1 in enumerate(memory_ids):
-            for mid2 in memory_ids[i + 1:]:
-                shared = memory_tags[mid1] & memory_tags[mid2]
-                if len(shared) >= min_shared:
+        if min_shared <= 0:
+            # Every pair qualifies, so everything is one cluster
+            for mid1, mid2 in zip(memory_ids, memory_ids[1:]):
+                union(mid1, mid2)
+        elif min_shared == 1:
+            # Sharing any tag is enough: chain each tag's members together
+            for members in tag_to_memories.values():
+                first, *rest = members
+                for mid in rest:
+                    union(first, mid)
+        else:
+            # Count shared tags per memory over the tag -> memories index, so
+            # only co-occurring memories are touched and the counts are dropped
+            # before moving on (a pair table would grow with every co-occurring
+            # pair)
+            for mid1 in memory_ids:
+                counts = Counter()
+                for tag in memory_tags[mid1]:
+                    counts.update(tag_to_memories[tag])
+                for mid2 in [m for m, shared in counts.items() if shared >= min_shared]:
                     union(mid1, mid2)
 
         # Collect clusters
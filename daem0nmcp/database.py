@@ -8,14 +8,44 @@ from sqlalchemy import event
 from contextlib import asynccontextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
+import json
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .models import Base, MemoryVersion  # noqa: F401 - MemoryVersion imported for table creation
 
 logger = logging.getLogger(__name__)
 
 
+def _orjson_serializer(value: Any) -> str:
+    """Serialize a JSON column value with orjson, falling back to the stdlib."""
+    try:
+        # Non-str keys are coerced to strings, matching json.dumps
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(value)
+
+
+def _orjson_deserializer(text: str) -> Any:
+    """Parse a JSON column value with orjson, tolerating rows the stdlib wrote (e.g. NaN)."""
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
+# JSON column (de)serializers for the engine; the stdlib is used without orjson
+_JSON_OPTIONS = (
+    {"json_serializer": _orjson_serializer, "json_deserializer": _orjson_deserializer}
+    if orjson is not None else {}
+)
+
+
 class DatabaseManager:
     """
     Manages the SQLite database connection.
@@ -46,6 +76,7 @@ class DatabaseManager:
                 # Each operation gets a fresh connection
                 poolclass=NullPool,
                 pool_pre_ping=True,
+                **_JSON_OPTIONS,
             )
 
             # Configure SQLite PRAGMAs for performance and reliability
@@ -9,11 +9,12 @@ This module handles:
 - Outcome tracking for learning
 """
 
+import asyncio
 import logging
 import os
 import re
 import sys
-from typing import Optional, List, Dict, Any, Tuple
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Tuple
 from datetime import datetime, timezone
 from pathlib import Path
 from sqlalchemy import select, or_, func, desc
@@ -31,6 +32,9 @@ from .cache import get_recall_cache, make_cache_key
 from . import vectors
 from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
 
+if TYPE_CHECKING:
+    from .qdrant_store import QdrantVectorStore
+
 # Valid relationship types for graph edges
 VALID_RELATIONSHIPS = frozenset({
     "led_to",         # A caused or resulted in B
@@ -170,16 +174,20 @@ class MemoryManager:
     Detects conflicts with existing memories.
     """
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, qdrant_store: Optional["QdrantVectorStore"] = None):
         self.db = db_manager
         self._index: Optional[TFIDFIndex] = None
         self._index_loaded = False
         self._vectors_enabled = vectors.is_available()
         self._index_built_at: Optional[datetime] = None
-
-        # Initialize Qdrant vector store if available
-        self._qdrant = None
-        if self._vectors_enabled:
+        self._index_lock = asyncio.Lock()
+        # Bumped by every invalidation; a load that overlaps one is discarded
+        self._index_generation = 0
+
+        # Initialize Qdrant vector store if available; a caller-provided
+        # store is used as-is and stays owned by the caller
+        self._qdrant = qdrant_store
+        if self._qdrant is None and self._vectors_enabled:
             # Prefer database manager's storage path for Qdrant (co-locates with SQLite)
             # This ensures tests with temp storage get their own Qdrant instance
             qdrant_path = str(Path(db_manager.storage_path) / "qdrant")
@@ -220,39 +228,62 @@ class MemoryManager:
 
         if await self.db.has_changes_since(self._index_built_at):
             logger.info("Database changed since index was built, rebuilding...")
-            self._index_loaded = False
-            self._index = None
+            self._mark_index_stale()
             # Qdrant is persistent and doesn't need rebuilding
             await self._ensure_index()
             return True
 
         return False
 
-    async def _ensure_index(self) -> TFIDFIndex:
-        """Ensure the TF-IDF index is loaded with all memories."""
-        if self._index is None:
-            self._index = TFIDFIndex()
+    def _mark_index_stale(self) -> None:
+        """
+        Force the next _ensure_index() to reload.
 
-        if not self._index_loaded:
-            async with self.db.get_session() as session:
-                result = await session.execute(
-                    select(Memory).where(_not_archived_condition())
-                )
-                memories = result.scalars().all()
+        The current index stays in place for callers already holding it; only
+        the loaded flag drops, and any load already in flight is discarded.
+        """
+        self._index_generation += 1
+        self._index_loaded = False
+
+    async def _load_index(self) -> Tuple[TFIDFIndex, int]:
+        """Build a fresh TF-IDF index of all non-archived memories."""
+        index = TFIDFIndex()
+        async with self.db.get_session() as session:
+            result = await session.execute(
+                select(Memory).where(_not_archived_condition())
+            )
+            memories = result.scalars().all()
 
-                for mem in memories:
-                    text = mem.content
-                    if mem.rationale:
-                        text += " " + mem.rationale
-                    self._index.add_document(mem.id, text, mem.tags)
-                    # Vectors are loaded from Qdrant (persistent), not SQLite
+            for mem in memories:
+                text = mem.content
+                if mem.rationale:
+                    text += " " + mem.rationale
+                index.add_document(mem.id, text, mem.tags)
+                # Vectors are loaded from Qdrant (persistent), not SQLite
 
-                self._index_loaded = True
-                self._index_built_at = datetime.now(timezone.utc)
-                qdrant_count = self._qdrant.get_count() if self._qdrant else 0
-                logger.info(f"Loaded {len(memories)} memories into TF-IDF index ({qdrant_count} vectors in Qdrant)")
+        return index, len(memories)
 
-        return self._index
+    async def _ensure_index(self) -> TFIDFIndex:
+        """Ensure the TF-IDF index is loaded with all memories."""
+        if self._index_loaded:
+            return self._index
+
+        # Serialize loads so concurrent callers don't index memories twice. The
+        # index is built locally and only published once filled, so callers
+        # never see a missing or half-built index.
+        async with self._index_lock:
+            while not self._index_loaded:
+                generation = self._index_generation
+                index, count = await self._load_index()
+                self._index = index
+                # Invalidated mid-load: this snapshot may be stale, load again
+                if generation == self._index_generation:
+                    self._index_loaded = True
+                    self._index_built_at = datetime.now(timezone.utc)
+                    qdrant_count = self._qdrant.get_count() if self._qdrant else 0
+                    logger.info(f"Loaded {count} memories into TF-IDF index ({qdrant_count} vectors in Qdrant)")
+
+            return self._index
 
     def _hybrid_search(
         self,
@@ -554,6 +585,7 @@ class MemoryManager:
 
         async with self.db.get_session() as session:
             created_ids = []
+            qdrant_points = []  # Upserted together once every row is flushed
 
             for i, mem in validated_memories:
                 category = mem["category"]
@@ -606,21 +638,17 @@ class MemoryManager:
                         text += " " + rationale
                     index.add_document(memory.id, text, tags)
 
-                    # Upsert to Qdrant if available
+                    # Queue for the Qdrant batch upsert if available
                     if self._qdrant and vector_embedding:
                         embedding_list = vectors.decode(vector_embedding)
                         if embedding_list:
-                            self._qdrant.upsert_memory(
-                                memory_id=memory.id,
-                                embedding=embedding_list,
-                                metadata={
-                                    "category": category,
-                                    "tags": tags,
-                                    "file_path": file_path_abs,
-                                    "worked": None,
-                                    "is_permanent": is_permanent
-                                }
-                            )
+                            qdrant_points.append((memory.id, embedding_list, {
+                                "category": category,
+                                "tags": tags,
+                                "file_path": file_path_abs,
+                                "worked": None,
+                                "is_permanent": is_permanent
+                            }))
 
                     created_ids.append(memory.id)
                     results["created_count"] += 1
@@ -632,6 +660,13 @@ class MemoryManager:
                     })
                     results["error_count"] += 1
 
+            if qdrant_points:
+                try:
+                    self._qdrant.upsert_memories(qdrant_points)
+                except (ResponseHandlingException, UnexpectedResponse, RuntimeError) as e:
+                    # Rows keep their SQLite embeddings; search falls back to TF-IDF
+                    logger.warning(f"Qdrant batch upsert failed for {len(qdrant_points)} memories: {e}")
+
             # Transaction commits here when exiting context manager
             results["ids"] = created_ids
 
@@ -1554,29 +1589,12 @@ class MemoryManager:
         Qdrant is persistent and doesn't need rebuilding.
         Returns statistics about the rebuild.
         """
-        # Clear existing TF-IDF index
-        self._index = TFIDFIndex()
-        self._index_loaded = False
-
-        # Rebuild TF-IDF from SQLite
-        async with self.db.get_session() as session:
-            result = await session.execute(
-                select(Memory).where(_not_archived_condition())
-            )
-            memories = result.scalars().all()
-
-            for mem in memories:
-                text = mem.content
-                if mem.rationale:
-                    text += " " + mem.rationale
-                self._index.add_document(mem.id, text, mem.tags)
-                # Qdrant is persistent and doesn't need rebuilding
-
-        self._index_loaded = True
-        self._index_built_at = datetime.now(timezone.utc)
+        # Rebuild TF-IDF from SQLite; Qdrant is persistent and doesn't need it
+        self._mark_index_stale()
+        index = await self._ensure_index()
 
         return {
-            "memories_indexed": len(memories),
+            "memories_indexed": index.doc_count,
             "vectors_indexed": self._qdrant.get_count() if self._qdrant else 0,
             "built_at": self._index_built_at.isoformat()
         }
@@ -11,6 +11,9 @@ from typing import List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Rows encoded and written per page during the vector backfill
+BACKFILL_BATCH_SIZE = 1000
+
 # Migration definitions: (version, description, sql_statements)
 MIGRATIONS: List[Tuple[int, str, List[str]]] = [
     (1, "Add vector_embedding column", [
@@ -254,10 +257,13 @@ def get_current_version(conn: sqlite3.Connection) -> int:
 
 def check_column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
     """Check if a column exists in a table."""
-    cursor = conn.cursor()
-    cursor.execute(f"PRAGMA table_info({table})")
-    columns = [row[1] for row in cursor.fetchall()]
-    return column in columns
+    # Table-valued pragma so the name is bound rather than formatted in,
+    # letting SQLite reuse the prepared statement across checks
+    cursor = conn.execute(
+        "SELECT 1 FROM pragma_table_info(?) WHERE name = ?",
+        (table, column)
+    )
+    return cursor.fetchone() is not None
 
 
 def run_migrations(db_path: str) -> Tuple[int, List[str]]:
@@ -277,6 +283,12 @@ def run_migrations(db_path: str) -> Tuple[int, List[str]]:
     applied = []
 
     try:
+        # Same journaling the runtime engine uses (see DatabaseManager): WAL
+        # with synchronous=NORMAL avoids a full fsync per migration commit
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
         current_version = get_current_version(conn)
 
         for version, description, statements in MIGRATIONS:
@@ -286,7 +298,8 @@ def run_migrations(db_path: str) -> Tuple[int, List[str]]:
             logger.info(f"Applying migration {version}: {description}")
 
             try:
-                conn.execute("BEGIN")
+                # Take the write lock up front rather than upgrading mid-migration
+                conn.execute("BEGIN IMMEDIATE")
                 for sql in statements:
                     sql = sql.strip()
                     if not sql:
@@ -325,6 +338,10 @@ def run_migrations(db_path: str) -> Tuple[int, List[str]]:
                 conn.rollback()
                 raise
 
+        if applied:
+            # Refresh planner statistics for any indexes the migrations created
+            conn.execute("ANALYZE")
+
     finally:
         conn.close()
 
@@ -363,36 +380,50 @@ def migrate_and_backfill_vectors(db_path: str) -> dict:
     # Backfill vectors for memories that don't have them
     conn = sqlite3.Connection(db_path)
     try:
+        # run_migrations above left the database in WAL mode
+        conn.execute("PRAGMA synchronous=NORMAL")
         cursor = conn.cursor()
 
-        # Find memories without vectors
-        cursor.execute("""
-            SELECT id, content, rationale
-            FROM memories
-            WHERE vector_embedding IS NULL
-        """)
-
-        memories = cursor.fetchall()
+        # Walk memories without vectors in id-ordered pages rather than
+        # materializing every row (and its embedding) before the first write
+        last_id = 0
+        seen = 0
+        while True:
+            cursor.execute("""
+                SELECT id, content, rationale
+                FROM memories
+                WHERE vector_embedding IS NULL AND id > ?
+                ORDER BY id
+                LIMIT ?
+            """, (last_id, BACKFILL_BATCH_SIZE))
+            batch = cursor.fetchall()
+            if not batch:
+                break
+            seen += len(batch)
+            last_id = batch[-1][0]
+
+            updates = []
+            for mem_id, content, rationale in batch:
+                text = content
+                if rationale:
+                    text += " " + rationale
+
+                embedding = vectors.encode(text)
+                if embedding:
+                    updates.append((embedding, mem_id))
+
+            # One prepared UPDATE per page
+            cursor.executemany(
+                "UPDATE memories SET vector_embedding = ? WHERE id = ?",
+                updates
+            )
+            result["vectors_backfilled"] += len(updates)
+            logger.info(f"Backfilled vectors for {result['vectors_backfilled']} of {seen} memories...")
 
-        if not memories:
+        if not seen:
             result["message"] = f"Schema updated ({count} migrations). All memories already have vectors."
             return result
 
-        logger.info(f"Backfilling vectors for {len(memories)} memories...")
-
-        for mem_id, content, rationale in memories:
-            text = content
-            if rationale:
-                text += " " + rationale
-
-            embedding = vectors.encode(text)
-            if embedding:
-                cursor.execute(
-                    "UPDATE memories SET vector_embedding = ? WHERE id = ?",
-                    (embedding, mem_id)
-                )
-                result["vectors_backfilled"] += 1
-
         conn.commit()
 
         result["message"] = (
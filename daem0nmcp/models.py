@@ -571,7 +571,7 @@ class FileHash(Base):
     id = Column(Integer, primary_key=True, index=True)
     project_path = Column(String, nullable=False, index=True)
     file_path = Column(String, nullable=False)  # Relative to project
-    content_hash = Column(String(64), nullable=False)  # SHA256
+    content_hash = Column(String(64), nullable=False)  # BLAKE3 or SHA-256 hex digest
     indexed_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     __table_args__ = (
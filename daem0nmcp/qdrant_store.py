@@ -39,16 +39,20 @@ class QdrantVectorStore:
     COLLECTION_CODE = "daem0n_code_entities"  # Reserved for Phase 2
     EMBEDDING_DIMENSION = 384  # all-MiniLM-L6-v2 output dimension
 
-    def __init__(self, path: str = "./storage/qdrant"):
+    def __init__(self, path: str = "./storage/qdrant", client: Optional[QdrantClient] = None):
         """
         Initialize the Qdrant vector store.
 
         Args:
             path: Directory path for local Qdrant storage.
                   Uses file-based mode (no server required).
+            client: Existing client to use instead of opening one at path
+                    (e.g. a shared in-memory client in tests).
         """
-        logger.info(f"Initializing Qdrant vector store at: {path}")
-        self.client = QdrantClient(path=path)
+        if client is None:
+            logger.info(f"Initializing Qdrant vector store at: {path}")
+            client = QdrantClient(path=path)
+        self.client = client
         self._ensure_collections()
 
     def _ensure_collections(self) -> None:
@@ -99,6 +103,23 @@ class QdrantVectorStore:
             )]
         )
 
+    def upsert_memories(self, points: list[tuple[int, list[float], dict]]) -> None:
+        """
+        Store or update several memories' embeddings in one upsert call.
+
+        Args:
+            points: (memory_id, embedding, metadata) tuples, as for upsert_memory().
+        """
+        if not points:
+            return
+        self.client.upsert(
+            collection_name=self.COLLECTION_MEMORIES,
+            points=[
+                PointStruct(id=memory_id, vector=embedding, payload=metadata)
+                for memory_id, embedding, metadata in points
+            ]
+        )
+
     def search(
         self,
         query_vector: list[float],
@@ -168,6 +189,12 @@ class QdrantVectorStore:
         info = self.client.get_collection(self.COLLECTION_MEMORIES)
         return info.points_count
 
+    def reset(self) -> None:
+        """Drop and recreate all collections, discarding every stored vector."""
+        for collection in (self.COLLECTION_MEMORIES, self.COLLECTION_CODE):
+            self.client.delete_collection(collection_name=collection)
+        self._ensure_collections()
+
     def close(self) -> None:
         """Close the Qdrant client connection."""
         self.client.close()
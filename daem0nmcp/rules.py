@@ -8,8 +8,9 @@ This module handles:
 - Learning from rule effectiveness
 """
 
+import asyncio
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timezone
 from sqlalchemy import select, desc
 
@@ -40,28 +41,45 @@ class RulesEngine:
         self._index: Optional[TFIDFIndex] = None
         self._index_loaded = False
         self._index_built_at: Optional[datetime] = None
+        self._index_lock = asyncio.Lock()
+        # Bumped by every invalidation; a load that overlaps one is discarded
+        self._index_generation = 0
 
-    async def _ensure_index(self) -> TFIDFIndex:
-        """Ensure the TF-IDF index is loaded with all rules."""
-        if self._index is None:
-            self._index = TFIDFIndex()
-
-        if not self._index_loaded:
-            async with self.db.get_session() as session:
-                result = await session.execute(
-                    select(Rule).where(Rule.enabled == True)  # noqa: E712
-                )
-                rules = result.scalars().all()
+    async def _load_index(self) -> Tuple[TFIDFIndex, int]:
+        """Build a fresh TF-IDF index of all enabled rules."""
+        index = TFIDFIndex()
+        async with self.db.get_session() as session:
+            result = await session.execute(
+                select(Rule).where(Rule.enabled == True)  # noqa: E712
+            )
+            rules = result.scalars().all()
 
-                for rule in rules:
-                    # Index the trigger text
-                    self._index.add_document(rule.id, rule.trigger)
+            for rule in rules:
+                # Index the trigger text
+                index.add_document(rule.id, rule.trigger)
 
-                self._index_loaded = True
-                self._index_built_at = datetime.now(timezone.utc)
-                logger.info(f"Loaded {len(rules)} rules into TF-IDF index")
+        return index, len(rules)
 
-        return self._index
+    async def _ensure_index(self) -> TFIDFIndex:
+        """Ensure the TF-IDF index is loaded with all rules."""
+        if self._index_loaded:
+            return self._index
+
+        # Serialize loads so concurrent callers don't index rules twice. The
+        # index is built locally and only published once filled, so callers
+        # never see a missing or half-built index.
+        async with self._index_lock:
+            while not self._index_loaded:
+                generation = self._index_generation
+                index, count = await self._load_index()
+                self._index = index
+                # Rules changed mid-load: this snapshot may be stale, load again
+                if generation == self._index_generation:
+                    self._index_loaded = True
+                    self._index_built_at = datetime.now(timezone.utc)
+                    logger.info(f"Loaded {count} rules into TF-IDF index")
+
+            return self._index
 
     async def _check_index_freshness(self) -> bool:
         """
@@ -73,18 +91,25 @@ class RulesEngine:
 
         if await self.db.has_changes_since(self._index_built_at):
             logger.info("Database changed since index was built, rebuilding...")
-            self._index_loaded = False
-            self._index = None
+            self._mark_index_stale()
             await self._ensure_index()
             return True
 
         return False
 
+    def _mark_index_stale(self) -> None:
+        """
+        Force the next _ensure_index() to reload.
+
+        The current index stays in place for callers already holding it; only
+        the loaded flag drops, and any load already in flight is discarded.
+        """
+        self._index_generation += 1
+        self._index_loaded = False
+
     def _invalidate_index(self) -> None:
         """Invalidate the index and cache when rules change."""
-        self._index_loaded = False
-        if self._index:
-            self._index = None
+        self._mark_index_stale()
         # Also clear the rules cache since rules changed
         get_rules_cache().clear()
 
@@ -432,22 +457,10 @@ class RulesEngine:
 
     async def rebuild_index(self) -> Dict[str, Any]:
         """Force rebuild of TF-IDF index for rules."""
-        self._index = TFIDFIndex()
-        self._index_loaded = False
-
-        async with self.db.get_session() as session:
-            result = await session.execute(
-                select(Rule).where(Rule.enabled == True)  # noqa: E712
-            )
-            rules = result.scalars().all()
-
-            for rule in rules:
-                self._index.add_document(rule.id, rule.trigger)
-
-        self._index_loaded = True
-        self._index_built_at = datetime.now(timezone.utc)
+        self._mark_index_stale()
+        index = await self._ensure_index()
 
         return {
-            "rules_indexed": len(rules),
+            "rules_indexed": index.doc_count,
             "built_at": self._index_built_at.isoformat()
         }
@@ -66,11 +66,18 @@ import atexit
 import subprocess
 import asyncio
 import base64
+import functools
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union, Set, Tuple
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Union, Set, Tuple
 from datetime import datetime, timezone, timedelta
 
+try:
+    # orjson parses JSON several times faster; the stdlib is the fallback
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 try:
     from mcp.server.fastmcp import FastMCP
 except ImportError:
@@ -99,6 +106,8 @@ except ImportError:
     from daem0nmcp.logging_config import StructuredFormatter, with_request_id, request_id_var, set_release_callback
     from daem0nmcp.covenant import requires_communion, requires_counsel, set_context_callback
 from sqlalchemy import select, delete, or_, func
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
 from dataclasses import dataclass, field
 
 # Configure logging
@@ -480,12 +489,17 @@ async def evict_stale_contexts() -> int:
 
 async def cleanup_all_contexts():
     """Clean up all project contexts on shutdown."""
-    for path, ctx in _project_contexts.items():
-        try:
-            await ctx.db_manager.close()
+    # Each context owns an independent engine, so dispose them concurrently
+    contexts = list(_project_contexts.items())
+    results = await asyncio.gather(
+        *(ctx.db_manager.close() for _, ctx in contexts),
+        return_exceptions=True,
+    )
+    for (path, _), result in zip(contexts, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Error closing database for {path}: {result}")
+        else:
             logger.info(f"Closed database for: {path}")
-        except Exception as e:
-            logger.warning(f"Error closing database for {path}: {e}")
     _project_contexts.clear()
 
 
@@ -767,7 +781,75 @@ BOOTSTRAP_EXCLUDED_DIRS = {
     '.ruff_cache', 'htmlcov', '.coverage', 'site-packages'
 }
 
+# Linter/formatter config files and the tool each one indicates
+BOOTSTRAP_CONVENTION_CONFIGS = (
+    (".eslintrc", "ESLint"),
+    (".eslintrc.js", "ESLint"),
+    (".eslintrc.json", "ESLint"),
+    (".prettierrc", "Prettier"),
+    (".prettierrc.json", "Prettier"),
+    ("prettier.config.js", "Prettier"),
+    ("ruff.toml", "Ruff"),
+    (".pylintrc", "Pylint"),
+    ("pylintrc", "Pylint"),
+    ("mypy.ini", "Mypy"),
+    (".flake8", "Flake8"),
+    ("setup.cfg", "Setup.cfg"),
+    ("tslint.json", "TSLint"),
+    ("biome.json", "Biome"),
+    (".editorconfig", "EditorConfig"),
+)
+
+# Top-level files worth listing in the architecture overview
+BOOTSTRAP_ENTRY_FILES = frozenset({
+    'main.py', 'app.py', 'index.ts', 'index.js', 'main.rs',
+    'main.go', 'Makefile', 'Dockerfile', 'docker-compose.yml'
+})
+
+
+def _project_root_signature(project_path: str) -> Optional[Tuple[Tuple[str, int, int], ...]]:
+    """
+    Fingerprint the top level of a project as (name, mtime_ns, size) per entry.
+
+    Covers every manifest/README/config the bootstrap extractors read, and a
+    directory's mtime changes when entries are added to or removed from it.
+    Returns None if the directory can't be listed.
+    """
+    try:
+        with os.scandir(project_path) as entries:
+            signature = []
+            for entry in entries:
+                if entry.name in BOOTSTRAP_EXCLUDED_DIRS:
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                signature.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        return None
+    signature.sort()
+    return tuple(signature)
+
+
+def _memoize_by_project_root(extractor):
+    """Cache an extractor's result until the project's top level changes."""
+    @functools.lru_cache(maxsize=128)
+    def cached(project_path: str, signature):
+        return extractor(project_path)
 
+    @functools.wraps(extractor)
+    def wrapper(project_path: str):
+        signature = _project_root_signature(project_path)
+        if signature is None:
+            return extractor(project_path)
+        return cached(project_path, signature)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@_memoize_by_project_root
 def _extract_project_identity(project_path: str) -> Optional[str]:
     """
     Extract project identity from manifest files.
@@ -788,7 +870,7 @@ def _extract_project_identity(project_path: str) -> Optional[str]:
     package_json = root / "package.json"
     if package_json.exists():
         try:
-            data = json.loads(package_json.read_text(encoding='utf-8', errors='ignore'))
+            data = json_loads(package_json.read_text(encoding='utf-8', errors='ignore'))
             parts = []
             if data.get('name'):
                 parts.append(f"Project: {data['name']}")
@@ -879,6 +961,7 @@ def _extract_project_identity(project_path: str) -> Optional[str]:
     return None
 
 
+@_memoize_by_project_root
 def _extract_architecture(project_path: str) -> Optional[str]:
     """
     Extract architecture overview from README and directory structure.
@@ -906,26 +989,28 @@ def _extract_architecture(project_path: str) -> Optional[str]:
                 logger.debug(f"Failed to read {readme_name}: {e}")
 
     # Extract directory structure (top 2 levels)
+    # scandir entries carry the file type from the directory listing, so no
+    # per-entry stat is needed to tell directories from files
     dirs = []
     files = []
     try:
-        for item in sorted(root.iterdir()):
-            name = item.name
-            if name.startswith('.') and name not in ['.github']:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            name = entry.name
+            if name.startswith('.') and name != '.github':
                 continue
             if name in BOOTSTRAP_EXCLUDED_DIRS:
                 continue
-            if item.is_dir():
+            if entry.is_dir():
                 # Get immediate children count
                 try:
-                    child_count = sum(1 for _ in item.iterdir())
+                    with os.scandir(entry.path) as children:
+                        child_count = sum(1 for _ in children)
                     dirs.append(f"  {name}/ ({child_count} items)")
                 except PermissionError:
                     dirs.append(f"  {name}/")
-            elif item.is_file() and name in [
-                'main.py', 'app.py', 'index.ts', 'index.js', 'main.rs',
-                'main.go', 'Makefile', 'Dockerfile', 'docker-compose.yml'
-            ]:
+            elif name in BOOTSTRAP_ENTRY_FILES and entry.is_file():
                 files.append(f"  {name}")
     except Exception as e:
         logger.debug(f"Failed to scan directory: {e}")
@@ -941,6 +1026,7 @@ def _extract_architecture(project_path: str) -> Optional[str]:
     return "Architecture overview:\n\n" + "\n\n".join(parts)
 
 
+@_memoize_by_project_root
 def _extract_conventions(project_path: str) -> Optional[str]:
     """
     Extract coding conventions from config files and docs.
@@ -956,12 +1042,21 @@ def _extract_conventions(project_path: str) -> Optional[str]:
     root = Path(project_path)
     parts = []
 
+    # One directory listing answers every probe below, instead of a stat per
+    # candidate file. Names are matched case-insensitively, as exists() does
+    # on Windows and macOS, and the on-disk name is used for reading
+    try:
+        with os.scandir(root) as it:
+            present = {entry.name.lower(): entry.name for entry in it}
+    except OSError:
+        present = {}
+
     # Check CONTRIBUTING.md
     for contrib_name in ["CONTRIBUTING.md", "CONTRIBUTING.rst", "CONTRIBUTING"]:
-        contrib = root / contrib_name
-        if contrib.exists():
+        actual_name = present.get(contrib_name.lower())
+        if actual_name:
             try:
-                content = contrib.read_text(encoding='utf-8', errors='ignore')[:1500]
+                content = (root / actual_name).read_text(encoding='utf-8', errors='ignore')[:1500]
                 if content.strip():
                     parts.append(f"Contributing guidelines:\n{content}")
                 break
@@ -969,34 +1064,16 @@ def _extract_conventions(project_path: str) -> Optional[str]:
                 logger.debug(f"Failed to read {contrib_name}: {e}")
 
     # Detect linter/formatter configs
-    config_files = [
-        (".eslintrc", "ESLint"),
-        (".eslintrc.js", "ESLint"),
-        (".eslintrc.json", "ESLint"),
-        (".prettierrc", "Prettier"),
-        (".prettierrc.json", "Prettier"),
-        ("prettier.config.js", "Prettier"),
-        ("ruff.toml", "Ruff"),
-        (".pylintrc", "Pylint"),
-        ("pylintrc", "Pylint"),
-        ("mypy.ini", "Mypy"),
-        (".flake8", "Flake8"),
-        ("setup.cfg", "Setup.cfg"),
-        ("tslint.json", "TSLint"),
-        ("biome.json", "Biome"),
-        (".editorconfig", "EditorConfig"),
+    found_configs = [
+        tool_name for filename, tool_name in BOOTSTRAP_CONVENTION_CONFIGS
+        if filename.lower() in present
     ]
 
-    found_configs = []
-    for filename, tool_name in config_files:
-        if (root / filename).exists():
-            found_configs.append(tool_name)
-
     # Check pyproject.toml for tool configs
-    pyproject = root / "pyproject.toml"
-    if pyproject.exists():
+    pyproject_name = present.get("pyproject.toml")
+    if pyproject_name:
         try:
-            content = pyproject.read_text(encoding='utf-8', errors='ignore')
+            content = (root / pyproject_name).read_text(encoding='utf-8', errors='ignore')
             if '[tool.black]' in content:
                 found_configs.append("Black")
             if '[tool.ruff]' in content:
@@ -4651,16 +4728,127 @@ async def triggered_context_resource(file_path: str) -> str:
     return await get_triggered_context_resource(file_path)
 
 
+# ============================================================================
+# HOOK ENDPOINTS - Plain HTTP fast path for Claude Code hooks
+# ============================================================================
+# Served only by the HTTP transports (start_server.py, --transport sse). Hooks
+# POST here to skip a CLI cold start and fall back to the CLI when unreachable.
+
+async def _hook_check_impl(file_path: str, project_path: str) -> Dict[str, Any]:
+    """
+    Implementation: Check a file against memories and rules.
+
+    Returns the same payload as `python -m daem0nmcp.cli check --json`.
+    """
+    try:
+        from .cli import check_file
+    except ImportError:
+        from daem0nmcp.cli import check_file
+
+    ctx = await get_project_context(project_path)
+    return await check_file(
+        file_path,
+        ctx.db_manager,
+        ctx.memory_manager,
+        ctx.rules_engine,
+        project_path=ctx.project_path
+    )
+
+
+async def _hook_check_triggers_impl(file_path: str, project_path: str) -> Dict[str, Any]:
+    """
+    Implementation: Check context triggers for a file and auto-recall memories.
+
+    Returns the same payload as `python -m daem0nmcp.cli check-triggers --json`.
+    """
+    try:
+        from .cli import check_triggers
+    except ImportError:
+        from daem0nmcp.cli import check_triggers
+
+    ctx = await get_project_context(project_path)
+    return await check_triggers(file_path, ctx.db_manager, project_path=ctx.project_path)
+
+
+async def _hook_check_all_impl(file_path: str, project_path: str) -> Dict[str, Any]:
+    """
+    Implementation: File recall and context triggers in one call.
+
+    Returns the same payload as `python -m daem0nmcp.cli check-all --json`.
+    """
+    try:
+        from .cli import check_all
+    except ImportError:
+        from daem0nmcp.cli import check_all
+
+    ctx = await get_project_context(project_path)
+    return await check_all(
+        file_path,
+        ctx.db_manager,
+        ctx.memory_manager,
+        ctx.rules_engine,
+        project_path=ctx.project_path
+    )
+
+
+async def _parse_hook_request(request: Request) -> Tuple[Optional[Dict[str, Any]], Optional[JSONResponse]]:
+    """Validate a hook request body: {"file": ..., "project_path": ...}."""
+    try:
+        payload = await request.json()
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None, JSONResponse({"error": "INVALID_JSON"}, status_code=400)
+
+    if not isinstance(payload, dict) or not payload.get("file"):
+        return None, JSONResponse({"error": "MISSING_FILE"}, status_code=400)
+
+    payload["project_path"] = payload.get("project_path") or _default_project_path
+    if not payload["project_path"]:
+        return None, JSONResponse(_missing_project_path_error(), status_code=400)
+
+    return payload, None
+
+
+async def _hook_response(request: Request, check: Callable[[str, str], Awaitable[Dict[str, Any]]]) -> Response:
+    """Run a hook check for a request, reporting any failure as a JSON error."""
+    payload, error = await _parse_hook_request(request)
+    if error:
+        return error
+    try:
+        result = await check(payload["file"], payload["project_path"])
+    except Exception as e:
+        # The hook falls back to the CLI on any non-2xx response
+        logger.error(f"Hook check failed for {payload['file']}: {e}")
+        return JSONResponse({"error": "CHECK_FAILED", "message": str(e)}, status_code=500)
+    return Response(json.dumps(result, default=str), media_type="application/json")
+
+
+@mcp.custom_route("/check", methods=["POST"])
+async def hook_check_endpoint(request: Request) -> Response:
+    """HTTP endpoint used by the pre-edit hook for file recall."""
+    return await _hook_response(request, _hook_check_impl)
+
+
+@mcp.custom_route("/check-triggers", methods=["POST"])
+async def hook_check_triggers_endpoint(request: Request) -> Response:
+    """HTTP endpoint used by the pre-edit hook for context triggers."""
+    return await _hook_response(request, _hook_check_triggers_impl)
+
+
+@mcp.custom_route("/check-all", methods=["POST"])
+async def hook_check_all_endpoint(request: Request) -> Response:
+    """HTTP endpoint used by the pre-edit hook for recall and triggers together."""
+    return await _hook_response(request, _hook_check_all_impl)
+
+
 # ============================================================================
 # Cleanup
 # ============================================================================
 async def _cleanup_all_contexts():
     """Close all project contexts."""
-    for ctx in _project_contexts.values():
-        try:
-            await ctx.db_manager.close()
-        except Exception:
-            pass
+    await asyncio.gather(
+        *(ctx.db_manager.close() for ctx in list(_project_contexts.values())),
+        return_exceptions=True,
+    )
 
 
 def cleanup():
@@ -0,0 +1,91 @@
+"""
+Shared text-signal patterns for the Daem0n Claude Code hooks.
+
+Hooks import this sibling module (the script directory is on sys.path when
+a hook runs), so the alternations below are compiled once per interpreter
+instead of being rebuilt by every hook that inspects assistant text.
+"""
+
+import re
+
+try:
+    # RE2 matches in linear time, so long assistant output can't trigger
+    # backtracking blowups in the signal patterns; stdlib re is the fallback
+    import re2 as _signal_re
+except ImportError:
+    _signal_re = re
+
+try:
+    # Aho-Corasick finds any of the prefilter keywords in one pass
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Completion signal patterns (case-insensitive)
+COMPLETION_PATTERNS = [
+    r"\ball\s+(?:tasks?|todos?|items?)\s+(?:are\s+)?(?:complete|done|finished)\b",
+    r"\bcompleted?\s+all\s+(?:tasks?|todos?|items?)\b",
+    r"\bmarking\s+.*\s+as\s+completed?\b",
+    r"\btask\s+(?:is\s+)?(?:complete|done|finished)\b",
+    r"\bimplementation\s+(?:is\s+)?(?:complete|done|finished)\b",
+    r"\bsuccessfully\s+(?:implemented|completed|finished)\b",
+    r"\bwork\s+(?:is\s+)?(?:complete|done|finished)\b",
+    r"\bchanges?\s+(?:have\s+been\s+)?(?:committed|pushed)\b",
+    r"\bpull\s+request\s+(?:created|opened)\b",
+    r"\bfeature\s+(?:is\s+)?(?:complete|ready|done)\b",
+    r"\bbug\s+(?:fix\s+)?(?:is\s+)?(?:complete|done|deployed)\b",
+]
+
+# Patterns that indicate Daem0n was already used appropriately
+DAEM0N_OUTCOME_PATTERNS = [
+    r"mcp__daem0nmcp__record_outcome",
+    r"record_outcome",
+    r"recorded?\s+(?:the\s+)?outcome",
+    r"outcome\s+(?:has\s+been\s+)?recorded",
+]
+
+# Patterns that indicate this is just research/exploration (no outcome needed)
+EXPLORATION_PATTERNS = [
+    r"\bhere(?:'s|\s+is)\s+(?:the\s+)?(?:information|answer|explanation)\b",
+    r"\bi\s+found\b",
+    r"\blet\s+me\s+explain\b",
+    r"\bthe\s+(?:code|file|function)\s+(?:is|does|works)\b",
+    r"\bbased\s+on\s+my\s+(?:research|analysis|exploration)\b",
+]
+
+
+def _compile_alternation(patterns: list[str]):
+    """Combine patterns into one case-insensitive alternation, compiled once."""
+    # Inline (?i) rather than a flag argument: both re and re2 accept it
+    return _signal_re.compile("(?i)" + "|".join(f"(?:{p})" for p in patterns))
+
+
+COMPLETION_RE = _compile_alternation(COMPLETION_PATTERNS)
+OUTCOME_RE = _compile_alternation(DAEM0N_OUTCOME_PATTERNS)
+EXPLORATION_RE = _compile_alternation(EXPLORATION_PATTERNS)
+
+# Every pattern in a group contains one of its keywords, so text without
+# any of them can be rejected with substring tests before the regex runs
+COMPLETION_KEYWORDS = (
+    "complete", "done", "finished", "implemented", "committed",
+    "pushed", "pull", "ready", "deployed",
+)
+OUTCOME_KEYWORDS = ("outcome",)
+EXPLORATION_KEYWORDS = ("here", "found", "explain", "code", "file", "function", "based")
+
+
+def _keyword_prefilter(keywords: tuple[str, ...]):
+    """Return a predicate: does already-lowercased text contain any keyword?"""
+    if ahocorasick is None:
+        return lambda text_lower: any(keyword in text_lower for keyword in keywords)
+
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return lambda text_lower: next(automaton.iter(text_lower), None) is not None
+
+
+COMPLETION_PREFILTER = _keyword_prefilter(COMPLETION_KEYWORDS)
+OUTCOME_PREFILTER = _keyword_prefilter(OUTCOME_KEYWORDS)
+EXPLORATION_PREFILTER = _keyword_prefilter(EXPLORATION_KEYWORDS)
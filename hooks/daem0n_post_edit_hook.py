@@ -56,7 +56,7 @@ def has_daem0n_setup() -> bool:
     """Check if Daem0n is set up."""
     if not PROJECT_DIR:
         return False
-    return (Path(PROJECT_DIR) / ".daem0nmcp").exists()
+    return os.path.isdir(os.path.join(PROJECT_DIR, ".daem0nmcp"))
 
 
 def is_significant_change(file_path: str, change_content: str) -> bool:
@@ -14,10 +14,16 @@ Output format: Text injected as context for Claude
 Exit code 0: Success (output added to context)
 """
 
+import io
 import json
 import os
 import sys
-from pathlib import Path
+
+try:
+    # orjson parses JSON several times faster; the stdlib is the fallback
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Environment variables from Claude Code
 PROJECT_DIR = os.environ.get("CLAUDE_PROJECT_DIR", "")
@@ -26,11 +32,15 @@ TOOL_INPUT = os.environ.get("TOOL_INPUT", "{}")
 # MCP server URL (for HTTP transport on Windows)
 MCP_URL = os.environ.get("DAEM0NMCP_URL", "http://localhost:9876/mcp")
 
+# Plain HTTP hook endpoints live at the server root, next to /mcp
+HOOK_BASE_URL = MCP_URL.rsplit("/mcp", 1)[0]
+HTTP_TIMEOUT = 2
+
 
 def get_file_path_from_tool_input() -> str | None:
     """Extract file_path from the tool input JSON."""
     try:
-        input_data = json.loads(TOOL_INPUT)
+        input_data = json_loads(TOOL_INPUT)
         # Edit and Write tools use "file_path"
         # NotebookEdit uses "notebook_path"
         return input_data.get("file_path") or input_data.get("notebook_path")
@@ -42,56 +52,52 @@ def has_daem0n_setup() -> bool:
     """Check if Daem0n is set up in this project."""
     if not PROJECT_DIR:
         return False
-    daem0n_dir = Path(PROJECT_DIR) / ".daem0nmcp"
-    return daem0n_dir.exists()
+    return os.path.isdir(os.path.join(PROJECT_DIR, ".daem0nmcp"))
 
 
-def recall_for_file_sync(file_path: str) -> dict | None:
+def _http_check(endpoint: str, payload: dict) -> dict | None:
     """
-    Call recall_for_file via the Daem0n CLI (synchronous).
+    POST to a hook endpoint on the running Daem0n HTTP server.
 
-    We use CLI instead of HTTP to avoid async complexity in hooks.
-    The CLI check command returns warnings, must_do, must_not.
+    Returns None when the server is unreachable (stdio transport, not
+    started, older version) so callers can fall back to the CLI.
     """
-    import subprocess
+    from urllib.request import Request, urlopen
 
+    request = Request(
+        HOOK_BASE_URL + endpoint,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
     try:
-        result = subprocess.run(
-            [
-                sys.executable, "-m", "daem0nmcp.cli",
-                "check", file_path,
-                "--project-path", PROJECT_DIR,
-                "--json"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            cwd=PROJECT_DIR
-        )
-
-        if result.returncode == 0 and result.stdout.strip():
-            return json.loads(result.stdout)
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
-        pass
-
-    return None
+        with urlopen(request, timeout=HTTP_TIMEOUT) as response:
+            return json_loads(response.read())
+    except (OSError, json.JSONDecodeError):
+        # URLError, HTTPError and socket timeouts are all OSErrors
+        return None
 
 
-def check_triggers_sync(file_path: str) -> dict | None:
+def check_all_sync(file_path: str) -> dict | None:
     """
-    Check context triggers via the Daem0n CLI (synchronous).
+    Run file recall and context triggers via the Daem0n server or CLI (synchronous).
 
-    Returns triggered context with auto-recalled memories.
+    The HTTP endpoint avoids a Python cold start on every edit; the CLI
+    check-all command is the fallback. Both return one document:
+    {"memories": <check payload>, "triggers": <check-triggers payload>}.
     """
+    result = _http_check("/check-all", {"file": file_path, "project_path": PROJECT_DIR})
+    if result is not None:
+        return result
+
     import subprocess
 
     try:
         result = subprocess.run(
             [
                 sys.executable, "-m", "daem0nmcp.cli",
-                "check-triggers", file_path,
                 "--project-path", PROJECT_DIR,
-                "--json"
+                "--json",
+                "check-all", file_path,
             ],
             capture_output=True,
             text=True,
@@ -107,6 +113,48 @@ def check_triggers_sync(file_path: str) -> dict | None:
     return None
 
 
+def _write_section(
+    buf: io.StringIO,
+    title: str,
+    items: list,
+    limit: int,
+    width: int,
+    outcome_width: int = 0,
+) -> None:
+    """Write a bold section title followed by up to `limit` bullet items.
+
+    Items are either plain strings or memory dicts with a "content" key;
+    when outcome_width is set, a memory's outcome is written beneath it.
+    """
+    if not items:
+        return
+
+    buf.write("**")
+    buf.write(title)
+    buf.write(":**\n")
+    for item in items[:limit]:
+        is_memory = isinstance(item, dict)
+        buf.write("  - ")
+        buf.write((item.get("content", "") if is_memory else item)[:width])
+        buf.write("\n")
+        if outcome_width and is_memory:
+            outcome = item.get("outcome")
+            if outcome:
+                buf.write("    Outcome: ")
+                buf.write(outcome[:outcome_width])
+                buf.write("\n")
+
+
+def _write_recalled(buf: io.StringIO, label: str, memories: list, limit: int) -> None:
+    """Write up to `limit` recalled memories tagged with `label`."""
+    for mem in memories[:limit]:
+        buf.write("    [")
+        buf.write(label)
+        buf.write("] ")
+        buf.write(mem.get("content", "")[:120])
+        buf.write("\n")
+
+
 def format_memories_context(memories: dict) -> str:
     """Format memories as human-readable context.
 
@@ -116,52 +164,41 @@ def format_memories_context(memories: dict) -> str:
     - must_not: list of strings
     - blockers: list (usually empty for file checks)
     """
-    parts = []
-    file_name = Path(memories.get("file", "")).name
+    buf = io.StringIO()
 
     # Warnings are most important
     warnings = memories.get("warnings", [])
 
-    # Split warnings by type
-    failed_approaches = [w for w in warnings if w.get("type") == "FAILED_APPROACH"]
-    general_warnings = [w for w in warnings if w.get("type") == "WARNING"]
-    rule_warnings = [w for w in warnings if w.get("type") == "RULE_WARNING"]
-
-    if failed_approaches:
-        parts.append("**Failed approaches (avoid repeating):**")
-        for f in failed_approaches[:3]:  # Limit to 3
-            content = f.get("content", "")[:150]
-            parts.append(f"  - {content}")
-            outcome = f.get("outcome")
-            if outcome:
-                parts.append(f"    Outcome: {outcome[:100]}")
-
-    if general_warnings:
-        parts.append("**Warnings for this file:**")
-        for w in general_warnings[:3]:  # Limit to 3
-            content = w.get("content", "")[:150]
-            parts.append(f"  - {content}")
-
-    if rule_warnings:
-        parts.append("**Rule warnings:**")
-        for w in rule_warnings[:2]:  # Limit to 2
-            content = w.get("content", "")[:150]
-            parts.append(f"  - {content}")
+    # Split warnings by type in one pass, stopping once every bucket
+    # holds as many items as its section will display
+    failed_approaches, general_warnings, rule_warnings = [], [], []
+    buckets = {
+        "FAILED_APPROACH": (failed_approaches, 3),
+        "WARNING": (general_warnings, 3),
+        "RULE_WARNING": (rule_warnings, 2),
+    }
+    unfilled = len(buckets)
+    for w in warnings:
+        bucket = buckets.get(w.get("type"))
+        if bucket is None:
+            continue
+        items, limit = bucket
+        if len(items) < limit:
+            items.append(w)
+            if len(items) == limit:
+                unfilled -= 1
+                if not unfilled:
+                    break
+
+    _write_section(buf, "Failed approaches (avoid repeating)", failed_approaches, 3, 150, outcome_width=100)
+    _write_section(buf, "Warnings for this file", general_warnings, 3, 150)
+    _write_section(buf, "Rule warnings", rule_warnings, 2, 150)
 
     # Must do / Must not from rules
-    must_do = memories.get("must_do", [])
-    if must_do:
-        parts.append("**Must do:**")
-        for item in must_do[:3]:
-            parts.append(f"  - {item[:100]}")
-
-    must_not = memories.get("must_not", [])
-    if must_not:
-        parts.append("**Must NOT do:**")
-        for item in must_not[:3]:
-            parts.append(f"  - {item[:100]}")
+    _write_section(buf, "Must do", memories.get("must_do", []), 3, 100)
+    _write_section(buf, "Must NOT do", memories.get("must_not", []), 3, 100)
 
-    return "\n".join(parts)
+    return buf.getvalue().removesuffix("\n")
 
 
 def format_trigger_context(trigger_result: dict) -> str:
@@ -171,38 +208,29 @@ def format_trigger_context(trigger_result: dict) -> str:
     - triggers: list of matched triggers
     - memories: dict of topic -> recalled memories
     """
-    parts = []
-
     triggers = trigger_result.get("triggers", [])
     memories = trigger_result.get("memories", {})
 
     if not triggers:
         return ""
 
-    parts.append("**Auto-recalled from context triggers:**")
+    buf = io.StringIO()
+    buf.write("**Auto-recalled from context triggers:**\n")
 
     for trigger in triggers[:3]:  # Limit to 3 triggers
-        pattern = trigger.get("pattern", "?")
-        topic = trigger.get("recall_topic", "?")
-        parts.append(f"  Trigger: {pattern} -> recall '{topic}'")
-
-    for topic, recalled in memories.items():
-        # Get warnings first (most important)
-        for mem in recalled.get("warnings", [])[:2]:
-            content = mem.get("content", "")[:120]
-            parts.append(f"    [warning] {content}")
+        buf.write("  Trigger: ")
+        buf.write(str(trigger.get("pattern", "?")))
+        buf.write(" -> recall '")
+        buf.write(str(trigger.get("recall_topic", "?")))
+        buf.write("'\n")
 
-        # Then patterns
-        for mem in recalled.get("patterns", [])[:2]:
-            content = mem.get("content", "")[:120]
-            parts.append(f"    [pattern] {content}")
+    for recalled in memories.values():
+        # Warnings first (most important), then patterns, then decisions
+        _write_recalled(buf, "warning", recalled.get("warnings", []), 2)
+        _write_recalled(buf, "pattern", recalled.get("patterns", []), 2)
+        _write_recalled(buf, "decision", recalled.get("decisions", []), 1)
 
-        # Then decisions
-        for mem in recalled.get("decisions", [])[:1]:
-            content = mem.get("content", "")[:120]
-            parts.append(f"    [decision] {content}")
-
-    return "\n".join(parts)
+    return buf.getvalue().removesuffix("\n")
 
 
 def main():
@@ -217,10 +245,14 @@ def main():
         sys.exit(0)
 
     output_parts = []
-    file_name = Path(file_path).name
+    file_name = os.path.basename(file_path)
+
+    # One request (or one CLI process) covers both file recall and triggers
+    result = check_all_sync(file_path) or {}
+    memories = result.get("memories")
+    trigger_result = result.get("triggers")
 
     # Recall memories for this file (direct file association)
-    memories = recall_for_file_sync(file_path)
     if memories:
         # Check if there are any relevant memories
         has_content = (
@@ -236,7 +268,6 @@ def main():
                 output_parts.append(context)
 
     # Check context triggers for auto-recall based on patterns
-    trigger_result = check_triggers_sync(file_path)
     if trigger_result and trigger_result.get("total_triggers", 0) > 0:
         trigger_context = format_trigger_context(trigger_result)
         if trigger_context:
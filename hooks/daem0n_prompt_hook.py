@@ -11,7 +11,6 @@ This provides a subtle, persistent reminder about the Daem0n protocol.
 import json
 import os
 import sys
-from pathlib import Path
 
 PROJECT_DIR = os.environ.get("CLAUDE_PROJECT_DIR", "")
 
@@ -21,11 +20,12 @@ def has_daem0n_tools() -> bool:
     if not PROJECT_DIR:
         return False
 
-    # Check for .daem0nmcp directory or skill
-    daem0n_dir = Path(PROJECT_DIR) / ".daem0nmcp"
-    skill_dir = Path(PROJECT_DIR) / ".claude" / "skills" / "daem0nmcp-protocol"
-
-    return daem0n_dir.exists() or skill_dir.exists()
+    # Check for .daem0nmcp directory or skill; plain os.path avoids pathlib
+    # on every prompt and the skill stat is skipped when the first hits
+    return (
+        os.path.isdir(os.path.join(PROJECT_DIR, ".daem0nmcp"))
+        or os.path.isdir(os.path.join(PROJECT_DIR, ".claude", "skills", "daem0nmcp-protocol"))
+    )
 
 
 def main():
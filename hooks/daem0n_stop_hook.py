@@ -21,46 +21,40 @@ import re
 import sys
 from pathlib import Path
 
+try:
+    # orjson parses JSON several times faster; the stdlib is the fallback
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+from _patterns import (
+    COMPLETION_PREFILTER,
+    COMPLETION_RE,
+    EXPLORATION_PREFILTER,
+    EXPLORATION_RE,
+    OUTCOME_PREFILTER,
+    OUTCOME_RE,
+)
+
 # Environment variables provided by Claude Code
 TRANSCRIPT_PATH = os.environ.get("CLAUDE_TRANSCRIPT_PATH", "")
 SESSION_ID = os.environ.get("CLAUDE_SESSION_ID", "")
 PROJECT_DIR = os.environ.get("CLAUDE_PROJECT_DIR", "")
 
+# Only the tail of the transcript is consulted (lookbacks are 5-10 messages)
+TRANSCRIPT_TAIL_LINES = 20
+TRANSCRIPT_BLOCK_SIZE = 64 * 1024
+
 # State file to prevent infinite loops
+# (created on first save; most invocations exit without writing state)
 STATE_DIR = Path.home() / ".daem0n_hook_state"
-STATE_DIR.mkdir(exist_ok=True)
-
-# Completion signal patterns (case-insensitive)
-COMPLETION_PATTERNS = [
-    r"\ball\s+(?:tasks?|todos?|items?)\s+(?:are\s+)?(?:complete|done|finished)\b",
-    r"\bcompleted?\s+all\s+(?:tasks?|todos?|items?)\b",
-    r"\bmarking\s+.*\s+as\s+completed?\b",
-    r"\btask\s+(?:is\s+)?(?:complete|done|finished)\b",
-    r"\bimplementation\s+(?:is\s+)?(?:complete|done|finished)\b",
-    r"\bsuccessfully\s+(?:implemented|completed|finished)\b",
-    r"\bwork\s+(?:is\s+)?(?:complete|done|finished)\b",
-    r"\bchanges?\s+(?:have\s+been\s+)?(?:committed|pushed)\b",
-    r"\bpull\s+request\s+(?:created|opened)\b",
-    r"\bfeature\s+(?:is\s+)?(?:complete|ready|done)\b",
-    r"\bbug\s+(?:fix\s+)?(?:is\s+)?(?:complete|done|deployed)\b",
-]
-
-# Patterns that indicate Daem0n was already used appropriately
-DAEM0N_OUTCOME_PATTERNS = [
-    r"mcp__daem0nmcp__record_outcome",
-    r"record_outcome",
-    r"recorded?\s+(?:the\s+)?outcome",
-    r"outcome\s+(?:has\s+been\s+)?recorded",
-]
-
-# Patterns that indicate this is just research/exploration (no outcome needed)
-EXPLORATION_PATTERNS = [
-    r"\bhere(?:'s|\s+is)\s+(?:the\s+)?(?:information|answer|explanation)\b",
-    r"\bi\s+found\b",
-    r"\blet\s+me\s+explain\b",
-    r"\bthe\s+(?:code|file|function)\s+(?:is|does|works)\b",
-    r"\bbased\s+on\s+my\s+(?:research|analysis|exploration)\b",
-]
+# SESSION_ID is fixed for the process, so the per-session path is too
+_SAFE_SESSION = re.sub(r'[^\w\-]', '_', SESSION_ID or "default")
+STATE_FILE = STATE_DIR / f"stop_hook_{_SAFE_SESSION}.state"
+# State is a few integers stored space-separated in this order
+STATE_KEYS = ("reminder_count", "exhausted")
+# Reminders per session before the hook goes quiet
+MAX_REMINDERS = 2
 
 # Patterns that indicate a decision was made (for auto-extraction)
 DECISION_PATTERNS = [
@@ -76,132 +70,200 @@ DECISION_PATTERNS = [
 FILE_MENTION_PATTERN = r"(?:in|to|from|at|file)\s+[`'\"]?([a-zA-Z0-9_/.-]+\.[a-zA-Z0-9]+)[`'\"]?"
 
 
-def get_state_file() -> Path:
-    """Get the state file path for the current session."""
-    safe_session = re.sub(r'[^\w\-]', '_', SESSION_ID or "default")
-    return STATE_DIR / f"stop_hook_{safe_session}.json"
-
-
 def load_state() -> dict:
     """Load the hook state for this session."""
-    state_file = get_state_file()
-    if state_file.exists():
-        try:
-            return json.loads(state_file.read_text())
-        except (json.JSONDecodeError, IOError):
-            pass
-    return {"reminder_count": 0, "last_reminder_turn": -1}
+    state = {"reminder_count": 0, "exhausted": 0}
+    try:
+        values = [int(value) for value in STATE_FILE.read_text().split()]
+        state.update(zip(STATE_KEYS, values))
+    except (ValueError, IOError):
+        pass
+    return state
 
 
 def save_state(state: dict) -> None:
     """Save the hook state for this session."""
-    state_file = get_state_file()
     try:
-        state_file.write_text(json.dumps(state))
+        STATE_DIR.mkdir(exist_ok=True)
+        STATE_FILE.write_text(" ".join(str(state.get(key, 0)) for key in STATE_KEYS))
     except IOError:
         pass
 
 
 def clear_state() -> None:
     """Clear the state file (for new sessions)."""
-    state_file = get_state_file()
     try:
-        state_file.unlink(missing_ok=True)
+        STATE_FILE.unlink(missing_ok=True)
     except IOError:
         pass
 
 
+def _tail_lines(path: str, max_lines: int = TRANSCRIPT_TAIL_LINES,
+                block: int = TRANSCRIPT_BLOCK_SIZE) -> list[bytes]:
+    """Return the last max_lines non-empty lines of a file, reading backwards from EOF."""
+    chunks = []
+    # Non-empty lines known to be complete, and whether the (possibly partial)
+    # line at the front of what has been read so far holds any text
+    complete = 0
+    front_has_text = False
+    # Raw fd reads: the tail is a few blocks, so the buffered file layer only adds copies
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        pos = os.lseek(fd, 0, os.SEEK_END)
+        while pos > 0 and complete < max_lines:
+            step = min(block, pos)
+            pos -= step
+            os.lseek(fd, pos, os.SEEK_SET)
+            chunk = os.read(fd, step)
+            chunks.append(chunk)
+
+            pieces = chunk.split(b"\n")
+            if len(pieces) == 1:
+                front_has_text = front_has_text or bool(chunk.strip())
+                continue
+            # A newline in this chunk completes the old front line; blank lines
+            # are skipped below, so only lines with text count towards the tail
+            complete += bool(pieces[-1].strip()) or front_has_text
+            complete += sum(1 for piece in pieces[1:-1] if piece.strip())
+            front_has_text = bool(pieces[0].strip())
+    finally:
+        os.close(fd)
+
+    data = b"".join(reversed(chunks))
+    if pos > 0:
+        # Drop the partial line at the start of the first block read
+        data = data[data.find(b"\n") + 1:]
+
+    lines = [line for line in data.splitlines() if line.strip()]
+    return lines[-max_lines:]
+
+
 def read_transcript() -> list[dict]:
-    """Read and parse the conversation transcript."""
-    if not TRANSCRIPT_PATH or not Path(TRANSCRIPT_PATH).exists():
+    """Read and parse the tail of the conversation transcript."""
+    if not TRANSCRIPT_PATH:
         return []
 
     messages = []
     try:
-        with open(TRANSCRIPT_PATH, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        messages.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+        for line in _tail_lines(TRANSCRIPT_PATH):
+            # Only assistant text and tool_use parts feed the matchers. Other
+            # lines (often large tool results) get an empty placeholder so
+            # the lookback windows still count them, without being parsed
+            if b'"assistant"' not in line and b'"tool_use"' not in line:
+                messages.append({})
+                continue
+            try:
+                messages.append(json_loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
     except IOError:
         pass
 
     return messages
 
 
+def tail_mentions_outcome() -> bool:
+    """Byte-level check for a recent record_outcome call, without parsing messages."""
+    if not TRANSCRIPT_PATH:
+        return False
+    try:
+        return any(
+            b"record_outcome" in line and b'"assistant"' in line
+            for line in _tail_lines(TRANSCRIPT_PATH)
+        )
+    except IOError:
+        return False
+
+
+def _content_strings(content) -> list[str]:
+    """Collect text and tool names from irregular (non-string) message content."""
+    strings = []
+    if isinstance(content, list):
+        for part in content:
+            if isinstance(part, dict):
+                if part.get("type") == "text":
+                    strings.append(part.get("text", ""))
+                elif part.get("type") == "tool_use":
+                    strings.append(part.get("name", ""))
+            elif isinstance(part, str):
+                strings.append(part)
+    return strings
+
+
 def get_recent_assistant_content(messages: list[dict], lookback: int = 5) -> str:
     """Extract recent assistant message content."""
     content_parts = []
 
     for msg in reversed(messages[-lookback:]):
-        if msg.get("role") == "assistant":
-            # Handle different content formats
-            content = msg.get("content", "")
-            if isinstance(content, str):
-                content_parts.append(content)
-            elif isinstance(content, list):
-                for part in content:
-                    if isinstance(part, dict):
-                        if part.get("type") == "text":
-                            content_parts.append(part.get("text", ""))
-                        elif part.get("type") == "tool_use":
-                            content_parts.append(part.get("name", ""))
-                    elif isinstance(part, str):
-                        content_parts.append(part)
+        if msg.get("role") != "assistant":
+            continue
+
+        content = msg.get("content", "")
+        if isinstance(content, str):
+            content_parts.append(content)
+            continue
+        try:
+            # Transcripts use a list of typed dict parts; handle that directly
+            # and only fall back to shape checks for anything else
+            strings = []
+            for part in content:
+                kind = part["type"]
+                if kind == "text":
+                    strings.append(part.get("text", ""))
+                elif kind == "tool_use":
+                    strings.append(part.get("name", ""))
+        except (KeyError, TypeError):
+            strings = _content_strings(content)
+        content_parts.extend(strings)
 
     return " ".join(content_parts)
 
 
 def get_recent_tool_calls(messages: list[dict], lookback: int = 10) -> list[str]:
-    """Extract recent tool call names from transcript."""
+    """Extract recent tool call names from transcript, lowercased for matching."""
     tool_calls = []
 
     for msg in messages[-lookback:]:
-        content = msg.get("content", [])
-        if isinstance(content, list):
-            for part in content:
-                if isinstance(part, dict) and part.get("type") == "tool_use":
-                    tool_calls.append(part.get("name", ""))
+        content = msg.get("content", ())
+        if isinstance(content, str):
+            continue
+        try:
+            names = [part.get("name", "").lower() for part in content if part["type"] == "tool_use"]
+        except (KeyError, TypeError):
+            # Malformed parts: keep only well-formed tool_use dicts
+            names = [
+                part.get("name", "").lower() for part in content
+                if isinstance(part, dict) and part.get("type") == "tool_use"
+            ] if isinstance(content, list) else []
+        tool_calls.extend(names)
 
     return tool_calls
 
 
 def has_completion_signal(text: str) -> bool:
     """Check if text contains completion signals."""
-    text_lower = text.lower()
-    for pattern in COMPLETION_PATTERNS:
-        if re.search(pattern, text_lower):
-            return True
-    return False
+    if not COMPLETION_PREFILTER(text.lower()):
+        return False
+    return COMPLETION_RE.search(text) is not None
 
 
 def has_daem0n_outcome(text: str, tool_calls: list[str]) -> bool:
     """Check if Daem0n record_outcome was called recently."""
-    text_lower = text.lower()
-
-    # Check tool calls
-    for tool in tool_calls:
-        if "record_outcome" in tool.lower():
-            return True
+    # Check tool calls (already lowercased by get_recent_tool_calls)
+    if any("record_outcome" in tool for tool in tool_calls):
+        return True
 
     # Check text mentions
-    for pattern in DAEM0N_OUTCOME_PATTERNS:
-        if re.search(pattern, text_lower):
-            return True
-
-    return False
+    if not OUTCOME_PREFILTER(text.lower()):
+        return False
+    return OUTCOME_RE.search(text) is not None
 
 
 def is_exploration_only(text: str) -> bool:
     """Check if this appears to be exploration/research without implementation."""
-    text_lower = text.lower()
-    for pattern in EXPLORATION_PATTERNS:
-        if re.search(pattern, text_lower):
-            return True
-    return False
+    if not EXPLORATION_PREFILTER(text.lower()):
+        return False
+    return EXPLORATION_RE.search(text) is not None
 
 
 def has_pending_decisions(text: str, tool_calls: list[str]) -> bool:
@@ -210,7 +272,7 @@ def has_pending_decisions(text: str, tool_calls: list[str]) -> bool:
 
     # Check for remember calls
     for tool in tool_calls:
-        if "remember" in tool.lower() and "record_outcome" not in tool.lower():
+        if "remember" in tool and "record_outcome" not in tool:
             return True
 
     # Check for decision mentions
@@ -305,21 +367,20 @@ def main():
     # Load state
     state = load_state()
 
+    # Once the reminder cap is hit, stay quiet without parsing the transcript
+    # until an outcome is recorded; that resets the budget so later work gets
+    # reminders again
+    if state["exhausted"]:
+        if tail_mentions_outcome():
+            clear_state()
+        sys.exit(0)
+
     # Read transcript
     messages = read_transcript()
     if not messages:
         # No transcript, nothing to do
         sys.exit(0)
 
-    current_turn = len(messages)
-
-    # Prevent infinite loops - don't remind twice in a row
-    if state.get("last_reminder_turn", -1) >= current_turn - 2:
-        # Already reminded recently, don't spam
-        if state.get("reminder_count", 0) >= 2:
-            # Too many reminders, give up for this session
-            sys.exit(0)
-
     # Get recent content and tool calls
     recent_content = get_recent_assistant_content(messages)
     recent_tools = get_recent_tool_calls(messages)
@@ -362,8 +423,8 @@ def main():
             sys.exit(0)
 
     # Completion detected but no outcome recorded - send reminder
-    state["reminder_count"] = state.get("reminder_count", 0) + 1
-    state["last_reminder_turn"] = current_turn
+    state["reminder_count"] += 1
+    state["exhausted"] = int(state["reminder_count"] >= MAX_REMINDERS)
     save_state(state)
 
     # Build reminder message
@@ -10,7 +10,8 @@ Usage:
     python scripts/condense_docstrings.py --apply
 """
 
-import re
+import ast
+import mmap
 import sys
 from pathlib import Path
 
@@ -407,39 +408,88 @@ CONDENSED_DOCSTRINGS = {
 }
 
 
-def find_function_docstring(content: str, func_name: str) -> tuple[int, int, str] | None:
-    """Find the docstring for a function, return (start, end, old_docstring) or None."""
-    # Pattern: async def func_name(...): followed by docstring
-    pattern = rf'(async\s+def\s+{func_name}\s*\([^)]*\)\s*(?:->\s*[^:]+)?\s*:\s*\n\s*)("""[\s\S]*?""")'
+# Fully formatted replacement docstrings as bytes, keyed by encoded name
+_CONDENSED_BYTES = {
+    func_name.encode(): f'"""\n    {condensed}\n    """'.encode()
+    for func_name, condensed in CONDENSED_DOCSTRINGS.items()
+}
 
-    match = re.search(pattern, content)
-    if match:
-        docstring_start = match.start(2)
-        docstring_end = match.end(2)
-        old_docstring = match.group(2)
-        return (docstring_start, docstring_end, old_docstring)
-    return None
 
+def _line_offsets(content: bytes) -> list[int]:
+    """Byte offset of the start of each line, indexed by 0-based line number."""
+    offsets = [0]
+    pos = content.find(b'\n')
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = content.find(b'\n', pos + 1)
+    return offsets
+
+
+def _find_docstring_spans(content: bytes) -> dict[bytes, tuple[int, int]]:
+    """Locate target docstrings in one AST pass. Returns {name: (start, end)} byte spans."""
+    tree = ast.parse(bytes(content))
+    lines = None
+    spans = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.AsyncFunctionDef):
+            continue
+        name = node.name.encode()
+        if name not in _CONDENSED_BYTES or not node.body:
+            continue
+        doc = node.body[0]
+        if not (isinstance(doc, ast.Expr) and isinstance(doc.value, ast.Constant)
+                and isinstance(doc.value.value, str)):
+            continue
+        if lines is None:
+            lines = _line_offsets(content)
+        # AST columns are UTF-8 byte offsets, so they index the raw content directly
+        start = lines[doc.lineno - 1] + doc.col_offset
+        end = lines[doc.end_lineno - 1] + doc.end_col_offset
+        if content[start:start + 3] != b'"""':
+            continue
+        # Only the first definition of each function is condensed
+        if name not in spans or start < spans[name][0]:
+            spans[name] = (start, end)
+    return spans
+
+
+def apply_condensed_docstrings(
+    content: bytes | mmap.mmap, dry_run: bool = True
+) -> tuple[bytes | bytearray | mmap.mmap, list[str]]:
+    """
+    Apply condensed docstrings to UTF-8 content (bytes or mmap). Returns (new_content, changes_made).
+
+    new_content is a new bytearray when applied; a dry run returns content itself.
+    """
+    replaced = {}  # encoded func_name -> (old_docstring, new_docstring)
+    spans = []  # (start, end, new_docstring) in file order
+
+    for name, (start, end) in sorted(_find_docstring_spans(content).items(), key=lambda item: item[1]):
+        new_docstring = _CONDENSED_BYTES[name]
+        replaced[name] = (content[start:end], new_docstring)
+        spans.append((start, end, new_docstring))
 
-def apply_condensed_docstrings(content: str, dry_run: bool = True) -> tuple[str, list[str]]:
-    """Apply condensed docstrings to content. Returns (new_content, changes_made)."""
-    changes = []
     new_content = content
-    offset = 0  # Track position changes as we modify
-
-    for func_name, condensed in CONDENSED_DOCSTRINGS.items():
-        result = find_function_docstring(new_content, func_name)
-        if result:
-            start, end, old_docstring = result
-            new_docstring = f'"""\n    {condensed}\n    """'
+    if not dry_run:
+        # Copy untouched ranges straight from a memoryview into one output
+        # buffer; slicing the view is zero-copy, unlike slicing bytes/mmap.
+        # The view is released on exit so a backing mmap can still close
+        new_content = bytearray()
+        with memoryview(content) as view:
+            pos = 0
+            for start, end, new_docstring in spans:
+                new_content += view[pos:start]
+                new_content += new_docstring
+                pos = end
+            new_content += view[pos:]
 
+    changes = []
+    for func_name, name in zip(CONDENSED_DOCSTRINGS, _CONDENSED_BYTES):
+        if name in replaced:
+            old_docstring, new_docstring = replaced[name]
             old_lines = len(old_docstring.splitlines())
             new_lines = len(new_docstring.splitlines())
-
             changes.append(f"{func_name}: {old_lines} lines -> {new_lines} lines (saved {old_lines - new_lines})")
-
-            if not dry_run:
-                new_content = new_content[:start] + new_docstring + new_content[end:]
         else:
             changes.append(f"{func_name}: NOT FOUND")
 
@@ -458,10 +508,10 @@ def main():
         print(f"Error: {server_path} not found")
         sys.exit(1)
 
-    content = server_path.read_text(encoding='utf-8')
-    original_size = len(content)
-
-    new_content, changes = apply_condensed_docstrings(content, dry_run)
+    # Scan a read-only mapping of the file; the map is closed before any write
+    with open(server_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+        original_size = len(content)
+        new_content, changes = apply_condensed_docstrings(content, dry_run)
 
     print(f"{'DRY RUN - ' if dry_run else ''}Condensing docstrings in {server_path.name}")
     print("=" * 60)
@@ -478,7 +528,7 @@ def main():
     print(f"Estimated token savings: ~{total_saved * 4} tokens")
 
     if not dry_run:
-        server_path.write_text(new_content, encoding='utf-8')
+        server_path.write_bytes(new_content)
         print(f"\nApplied changes to {server_path}")
         print(f"File size: {original_size:,} -> {len(new_content):,} bytes")
     else:
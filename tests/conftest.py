@@ -3,11 +3,15 @@
 Pytest configuration for Daem0nMCP tests.
 """
 
+import asyncio
 import getpass
 import os
 import shutil
+import sys
 import tempfile
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -16,7 +20,70 @@ import pytest
 pytest_plugins = ('pytest_asyncio',)
 
 
-SAFE_TMP_ROOT = Path(__file__).resolve().parent.parent / ".test_tmp"
+# Free space a RAM-backed temp root must have before tests are pointed at it
+_MIN_TMPFS_FREE = 1 << 30
+
+
+def _pick_tmp_root() -> Path:
+    """
+    Choose where test temp directories live.
+
+    On Linux, prefer tmpfs (/dev/shm) when it is writable and roomy: mkdir and
+    rmtree there are in-RAM inode operations with no journal writes. Windows
+    and anything else keep the repo-relative root, which avoids restricted
+    system temp directories.
+    """
+    repo_root = Path(__file__).resolve().parent.parent / ".test_tmp"
+    if not sys.platform.startswith("linux"):
+        return repo_root
+    shm = "/dev/shm"
+    try:
+        if os.path.isdir(shm) and os.access(shm, os.W_OK) and shutil.disk_usage(shm).free >= _MIN_TMPFS_FREE:
+            return Path(shm) / f".daem0n_test_tmp-{os.getuid()}"
+    except OSError:
+        pass
+    return repo_root
+
+
+SAFE_TMP_ROOT = _pick_tmp_root()
+
+# On tmpfs rmtree is cheap, and leaving directories queued holds RAM (once per
+# xdist worker), so released directories are removed straight away
+_TMP_ROOT_IN_RAM = SAFE_TMP_ROOT.parent == Path("/dev/shm")
+
+# Temp directories released during the run are queued and removed in batches
+# on background threads, so teardown doesn't wait on rmtree and no more than
+# about one batch of finished tests' directories is left on disk
+_CLEANUP_BATCH_SIZE = 32
+_PENDING_CLEANUP: list[str] = []
+_PENDING_CLEANUP_LOCK = threading.Lock()
+_CLEANUP_EXECUTOR: ThreadPoolExecutor | None = None
+_SESSION_FINISHED = False
+
+
+def _submit_cleanup(paths: list[str]) -> None:
+    """Start removing paths in the background. Call with the cleanup lock held."""
+    global _CLEANUP_EXECUTOR
+    if _CLEANUP_EXECUTOR is None:
+        _CLEANUP_EXECUTOR = ThreadPoolExecutor(
+            max_workers=(os.cpu_count() or 1) * 4, thread_name_prefix="test-tmp-cleanup"
+        )
+    for path in paths:
+        _CLEANUP_EXECUTOR.submit(shutil.rmtree, path, ignore_errors=True)
+
+
+def _defer_rmtree(path: str) -> None:
+    """Remove a released temp directory: at once on tmpfs, else via the batch queue."""
+    with _PENDING_CLEANUP_LOCK:
+        if not _SESSION_FINISHED and not _TMP_ROOT_IN_RAM:
+            _PENDING_CLEANUP.append(path)
+            if len(_PENDING_CLEANUP) >= _CLEANUP_BATCH_SIZE:
+                _submit_cleanup(_PENDING_CLEANUP[:])
+                _PENDING_CLEANUP.clear()
+            return
+    # Root in RAM, or released after the session finished (e.g. collected at
+    # interpreter exit)
+    shutil.rmtree(path, ignore_errors=True)
 
 
 def _safe_mkdtemp(suffix: str | None = None, prefix: str | None = None, dir: str | None = None) -> str:
@@ -33,12 +100,15 @@ def _safe_mkdtemp(suffix: str | None = None, prefix: str | None = None, dir: str
 class _SafeTemporaryDirectory:
     def __init__(self, suffix: str | None = None, prefix: str | None = None, dir: str | None = None):
         self.name = _safe_mkdtemp(suffix=suffix, prefix=prefix, dir=dir)
+        self._released = False
 
     def __enter__(self) -> str:
         return self.name
 
     def cleanup(self) -> None:
-        shutil.rmtree(self.name, ignore_errors=True)
+        if not self._released:
+            self._released = True
+            _defer_rmtree(self.name)
 
     def __exit__(self, exc_type, exc, tb) -> None:
         self.cleanup()
@@ -71,14 +141,94 @@ def pytest_configure(config):
     pytest_tmp_base.mkdir(parents=True, exist_ok=True)
 
 
+def pytest_sessionfinish(session, exitstatus):
+    """Remove the last partial batch of temp directories and wait for cleanup.
+
+    Per-test rmtree is dominated by filesystem metadata syscalls (notably on
+    Windows), so teardown only queues paths and batches are deleted in the
+    background; this drains whatever is still queued or in flight.
+    """
+    global _SESSION_FINISHED
+    with _PENDING_CLEANUP_LOCK:
+        _SESSION_FINISHED = True
+        if _PENDING_CLEANUP:
+            _submit_cleanup(_PENDING_CLEANUP[:])
+            _PENDING_CLEANUP.clear()
+        executor = _CLEANUP_EXECUTOR
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop where it is installed (not available on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
 @pytest.fixture
 def tmp_path(tmp_path_factory):
     """Override tmp_path to use our safe temp root."""
     # Create a unique temp directory under our safe root
     path = Path(_safe_mkdtemp(prefix="pytest_"))
     yield path
-    # Cleanup after test
-    shutil.rmtree(path, ignore_errors=True)
+    # Cleanup is batched at session end
+    _defer_rmtree(str(path))
+
+
+@pytest.fixture(scope="session")
+def qdrant_store():
+    """
+    Session-wide in-memory Qdrant store.
+
+    Opening an on-disk store per test spins up fresh segments and a WAL each
+    time; tests that share this one call reset() between uses instead.
+    """
+    from qdrant_client import QdrantClient
+    from daem0nmcp.qdrant_store import QdrantVectorStore
+
+    store = QdrantVectorStore(client=QdrantClient(location=":memory:"))
+    yield store
+    store.close()
+
+
+@pytest.fixture(scope="session")
+def migrated_db_template():
+    """
+    Path to a database file with the full schema and migrations applied.
+
+    Built once per session; create_all plus the migration chain costs several
+    times more than copying the finished file.
+    """
+    from daem0nmcp.database import DatabaseManager
+
+    storage = _safe_mkdtemp(prefix="db_template_")
+    db = DatabaseManager(storage)
+
+    async def build():
+        await db.init_db()
+        await db.close()
+
+    asyncio.run(build())
+    yield db.db_path
+    _defer_rmtree(storage)
+
+
+@pytest.fixture
+def migrated_storage(migrated_db_template):
+    """
+    Fresh storage directory holding a private copy of the migrated database.
+
+    Each test still owns its database file, so absolute row counts stay
+    isolated; init_db() on the copy only verifies the schema.
+    """
+    storage = _safe_mkdtemp(prefix="storage_")
+    shutil.copy2(migrated_db_template, storage)
+    yield storage
+    _defer_rmtree(storage)
 
 
 async def ensure_covenant_compliance(project_path: str):
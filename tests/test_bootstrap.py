@@ -60,6 +60,17 @@ dependencies = ["fastapi", "sqlalchemy"]
 
         assert "node-app" in result
 
+    def test_result_refreshes_when_manifest_changes(self, tmp_path):
+        """Cached identity should be recomputed once the manifest is edited."""
+        manifest = tmp_path / "package.json"
+        manifest.write_text('{"name": "first-app"}')
+        assert "first-app" in _extract_project_identity(str(tmp_path))
+        assert "first-app" in _extract_project_identity(str(tmp_path))
+
+        manifest.write_text('{"name": "renamed-app"}')
+
+        assert "renamed-app" in _extract_project_identity(str(tmp_path))
+
 
 class TestExtractArchitecture:
     """Tests for _extract_architecture extractor."""
@@ -411,17 +422,10 @@ export async function fetchData(url: string) {
 
         # Initialize git repo with at least one commit
         subprocess.run(["git", "init"], cwd=str(tmp_path), capture_output=True, check=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=str(tmp_path), capture_output=True, check=True
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=str(tmp_path), capture_output=True, check=True
-        )
         subprocess.run(["git", "add", "."], cwd=str(tmp_path), capture_output=True, check=True)
         subprocess.run(
-            ["git", "commit", "-m", "Initial commit"],
+            ["git", "-c", "user.email=test@test.com", "-c", "user.name=Test User",
+             "commit", "-m", "Initial commit"],
             cwd=str(tmp_path), capture_output=True, check=True
         )
 
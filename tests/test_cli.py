@@ -183,6 +183,16 @@ class TestCheckCommand:
         data = json.loads(result.stdout)
         assert "file" in data
 
+    def test_check_all_combines_check_and_triggers(self, temp_project):
+        """Test that check-all returns both payloads in one document."""
+        result = run_cli("--json", "check-all", "nonexistent.py", project_path=temp_project)
+        assert result.returncode == 0
+
+        data = json.loads(result.stdout)
+        assert data["memories"]["file"] == "nonexistent.py"
+        assert "warnings" in data["memories"]
+        assert data["triggers"]["total_triggers"] == 0
+
 
 class TestRecordOutcomeCommand:
     """Tests for the record-outcome command."""
@@ -160,6 +160,32 @@ class TestTreeSitterIndexer:
         assert '.go' in extensions
         assert '.rs' in extensions
 
+    def test_language_shared_parser_per_indexer(self, monkeypatch):
+        """Indexers share a loaded Language but each gets its own Parser."""
+        import tree_sitter
+        import tree_sitter_language_pack
+        from daem0nmcp import code_indexer
+
+        language = tree_sitter_language_pack.get_language("python")
+        calls = []
+
+        def counting_get_language(lang):
+            calls.append(lang)
+            return language
+
+        monkeypatch.setattr(tree_sitter_language_pack, "get_language", counting_get_language)
+        monkeypatch.setattr(code_indexer, "_LANGUAGE_CACHE", {})
+
+        first, second = code_indexer.TreeSitterIndexer(), code_indexer.TreeSitterIndexer()
+        parser_a, language_a = first.get_parser("python")
+        parser_b, language_b = second.get_parser("python")
+
+        assert calls == ["python"]
+        assert language_a is language_b is language
+        assert isinstance(parser_a, tree_sitter.Parser)
+        assert parser_a is not parser_b
+        assert first.get_parser("python")[0] is parser_a
+
     def test_index_python_file(self, temp_project):
         """Test indexing a Python file."""
         from daem0nmcp.code_indexer import TreeSitterIndexer
@@ -1,8 +1,10 @@
 """Tests for memory community clustering and hierarchical summaries."""
 
 import pytest
+import random
 import tempfile
 import shutil
+from collections import defaultdict
 from datetime import datetime, timezone
 
 from daem0nmcp.models import MemoryCommunity
@@ -84,10 +86,10 @@ async def test_memory_communities_table_created(temp_storage):
 
 
 @pytest.fixture
-async def db_manager(temp_storage):
+async def db_manager(migrated_storage):
     """Shared database manager for community tests."""
     from daem0nmcp.database import DatabaseManager
-    db = DatabaseManager(temp_storage)
+    db = DatabaseManager(migrated_storage)
     await db.init_db()
     yield db
     await db.close()
@@ -101,31 +103,26 @@ async def community_manager(db_manager):
 
 
 @pytest.fixture
-async def memory_manager(db_manager):
-    """Create a memory manager with shared database."""
+async def memory_manager(db_manager, qdrant_store):
+    """Create a memory manager with shared database and the session Qdrant store."""
     from daem0nmcp.memory import MemoryManager
-    manager = MemoryManager(db_manager)
+    manager = MemoryManager(db_manager, qdrant_store=qdrant_store)
     yield manager
-    if manager._qdrant:
-        manager._qdrant.close()
+    # Empty the shared store for the next test instead of closing it
+    qdrant_store.reset()
 
 
 @pytest.mark.asyncio
 async def test_detect_communities_by_tags(community_manager, memory_manager):
     """Should cluster memories that share tags."""
-    # Create memories with overlapping tags
-    await memory_manager.remember(
-        category="decision", content="Use JWT for auth", tags=["auth", "jwt"]
-    )
-    await memory_manager.remember(
-        category="pattern", content="Validate JWT expiry", tags=["auth", "jwt", "validation"]
-    )
-    await memory_manager.remember(
-        category="decision", content="Use Redis for cache", tags=["cache", "redis"]
-    )
-    await memory_manager.remember(
-        category="pattern", content="Cache invalidation strategy", tags=["cache", "redis"]
-    )
+    # Create memories with overlapping tags in one transaction
+    result = await memory_manager.remember_batch([
+        {"category": "decision", "content": "Use JWT for auth", "tags": ["auth", "jwt"]},
+        {"category": "pattern", "content": "Validate JWT expiry", "tags": ["auth", "jwt", "validation"]},
+        {"category": "decision", "content": "Use Redis for cache", "tags": ["cache", "redis"]},
+        {"category": "pattern", "content": "Cache invalidation strategy", "tags": ["cache", "redis"]},
+    ])
+    assert result["created_count"] == 4
 
     # Detect communities
     communities = await community_manager.detect_communities(
@@ -142,6 +139,50 @@ async def test_detect_communities_by_tags(community_manager, memory_manager):
     assert auth_community["member_count"] == 2
 
 
+def pairwise_clusters(memory_tags, min_shared):
+    """Reference clustering: intersect the tags of every pair of memories."""
+    parent = {mid: mid for mid in memory_tags}
+
+    def find(x):
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    memory_ids = list(memory_tags)
+    for i, mid1 in enumerate(memory_ids):
+        for mid2 in memory_ids[i + 1:]:
+            if len(memory_tags[mid1] & memory_tags[mid2]) >= min_shared:
+                parent[find(mid1)] = find(mid2)
+
+    clusters = defaultdict(set)
+    for mid in memory_ids:
+        clusters[find(mid)].add(mid)
+    return sorted(sorted(members) for members in clusters.values())
+
+
+@pytest.mark.parametrize("min_shared", [0, 1, 2, 3])
+def test_cluster_by_shared_tags_matches_pairwise(min_shared):
+    """Every clustering branch groups memories exactly like the pairwise check."""
+    from daem0nmcp.communities import CommunityManager
+
+    manager = CommunityManager(None)
+    rng = random.Random(min_shared)
+    for _ in range(50):
+        vocabulary = [f"tag{i}" for i in range(rng.randint(1, 12))]
+        memory_tags = {
+            mid: set(rng.sample(vocabulary, rng.randint(0, min(4, len(vocabulary)))))
+            for mid in rng.sample(range(1000), rng.randint(1, 40))
+        }
+        tag_to_memories = defaultdict(set)
+        for mid, tags in memory_tags.items():
+            for tag in tags:
+                tag_to_memories[tag].add(mid)
+
+        clusters = manager._cluster_by_shared_tags(memory_tags, tag_to_memories, min_shared)
+
+        assert sorted(sorted(members) for members in clusters.values()) == pairwise_clusters(memory_tags, min_shared)
+
+
 @pytest.fixture
 async def covenant_compliant_project(temp_storage):
     """Create a project that passes communion checks."""
@@ -249,15 +290,11 @@ async def test_hierarchical_recall(memory_manager, temp_storage):
     """Hierarchical recall should return community summaries first."""
     from daem0nmcp.communities import CommunityManager
 
-    # Create related memories
-    await memory_manager.remember(
-        category="decision", content="Use JWT for auth",
-        tags=["auth", "jwt"]
-    )
-    await memory_manager.remember(
-        category="pattern", content="Validate JWT on every request",
-        tags=["auth", "jwt", "validation"]
-    )
+    # Create related memories in one transaction
+    await memory_manager.remember_batch([
+        {"category": "decision", "content": "Use JWT for auth", "tags": ["auth", "jwt"]},
+        {"category": "pattern", "content": "Validate JWT on every request", "tags": ["auth", "jwt", "validation"]},
+    ])
 
     # Build communities
     cm = CommunityManager(memory_manager.db)
@@ -6,8 +6,6 @@ of caching and memory operations.
 
 import pytest
 import asyncio
-import tempfile
-import shutil
 
 from daem0nmcp.database import DatabaseManager
 from daem0nmcp.memory import MemoryManager
@@ -16,17 +14,9 @@ from daem0nmcp.cache import TTLCache, get_recall_cache, get_rules_cache
 
 
 @pytest.fixture
-def temp_storage():
-    """Create a temporary storage directory."""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    shutil.rmtree(temp_dir)
-
-
-@pytest.fixture
-async def db_manager(temp_storage):
-    """Create a database manager with temporary storage."""
-    db = DatabaseManager(temp_storage)
+async def db_manager(migrated_storage):
+    """Create a database manager on a copy of the migrated database."""
+    db = DatabaseManager(migrated_storage)
     await db.init_db()
     yield db
     await db.close()
@@ -151,6 +141,59 @@ class TestConcurrentMemoryAccess:
         assert len(results) == 5
         assert all("id" in r for r in results)
 
+    @pytest.mark.asyncio
+    async def test_concurrent_index_load(self, memory_manager, monkeypatch):
+        """Test that concurrent first loads build the TF-IDF index only once."""
+        for i in range(5):
+            await memory_manager.remember(
+                category="decision",
+                content=f"Decision for index load test {i}"
+            )
+
+        from daem0nmcp.similarity import TFIDFIndex
+
+        added = []
+        original_add = TFIDFIndex.add_document
+
+        def counting_add(self, doc_id, text, tags=None):
+            added.append(doc_id)
+            return original_add(self, doc_id, text, tags)
+
+        monkeypatch.setattr(TFIDFIndex, "add_document", counting_add)
+
+        # Drop the index so every caller races on the initial load
+        memory_manager._index = None
+        memory_manager._index_loaded = False
+        indexes = await asyncio.gather(*[memory_manager._ensure_index() for _ in range(5)])
+
+        assert all(index is indexes[0] for index in indexes)
+        assert len(added) == 5
+
+        # An external change arrives, and a second reset lands while the
+        # rebuild is still filling the index; no caller may see a missing index
+        async def changed(since):
+            return True
+
+        def add_during_reset(self, doc_id, text, tags=None):
+            added.append(doc_id)
+            if len(added) == 6:
+                memory_manager._mark_index_stale()
+            return original_add(self, doc_id, text, tags)
+
+        monkeypatch.setattr(memory_manager.db, "has_changes_since", changed)
+        monkeypatch.setattr(TFIDFIndex, "add_document", add_during_reset)
+        results = await asyncio.gather(
+            memory_manager._check_index_freshness(),
+            *[memory_manager._ensure_index() for _ in range(5)],
+        )
+
+        assert results[0] is True
+        assert all(index is results[1] and index is not None for index in results[1:])
+        assert memory_manager._index_loaded
+        assert memory_manager._index.doc_count == 5
+        # The interrupted rebuild was discarded and loaded again
+        assert len(added) == 15
+
 
 class TestConcurrentRulesAccess:
     """Test concurrent rules operations."""
@@ -200,6 +243,36 @@ class TestConcurrentRulesAccess:
         assert len(results) == 10
         assert all("action" in r for r in results)
 
+    @pytest.mark.asyncio
+    async def test_invalidation_during_index_load(self, rules_engine, monkeypatch):
+        """Test that a rule change landing mid-load never exposes a missing index."""
+        for i in range(5):
+            await rules_engine.add_rule(
+                trigger=f"Mid-load trigger {i}",
+                must_do=[f"Action {i}"]
+            )
+
+        from daem0nmcp.similarity import TFIDFIndex
+
+        added = []
+        original_add = TFIDFIndex.add_document
+
+        def add_and_invalidate(self, doc_id, text, tags=None):
+            added.append(doc_id)
+            if len(added) == 1:
+                rules_engine._invalidate_index()
+            return original_add(self, doc_id, text, tags)
+
+        monkeypatch.setattr(TFIDFIndex, "add_document", add_and_invalidate)
+        rules_engine._invalidate_index()
+        indexes = await asyncio.gather(*[rules_engine._ensure_index() for _ in range(5)])
+
+        assert all(index is indexes[0] and index is not None for index in indexes)
+        assert rules_engine._index_loaded
+        assert rules_engine._index.doc_count == 5
+        # The interrupted load was discarded and loaded again
+        assert len(added) == 10
+
     @pytest.mark.asyncio
     async def test_concurrent_add_and_check_rules(self, rules_engine):
         """Test interleaved add_rule and check_rules operations."""
@@ -0,0 +1,141 @@
+"""Tests for scripts/condense_docstrings.py."""
+
+import ast
+import importlib.util
+import mmap
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "scripts" / "condense_docstrings.py"
+
+
+@pytest.fixture
+def condense():
+    """Load the script as a module."""
+    spec = importlib.util.spec_from_file_location("condense_docstrings", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_source(target: str) -> bytes:
+    """A small module with one condensable function among things to leave alone."""
+    return f'''"""Fixture module."""
+
+
+@mcp.tool()
+async def {target}(
+    project_path: str,
+    limit: int = 10,
+) -> dict:
+    """
+    A long-winded docstring — with non-ASCII text.
+
+    Args:
+        project_path: The project root
+        limit: The maximum
+
+    Returns:
+        A dict
+    """
+    return {{"ok": True}}
+
+
+async def untouched(x) -> int:
+    """Leave this docstring alone."""
+    return x
+
+
+async def {target}_helper():
+    """
+    Similar name, different function.
+    """
+
+
+async def {target}(project_path: str):
+    """
+    A later redefinition; only the first definition is condensed.
+    """
+'''.encode()
+
+
+class TestApplyCondensedDocstrings:
+    """Round-trip the docstring rewrite on a fixture module."""
+
+    def test_round_trip(self, condense):
+        """Applying rewrites only the target docstring and stays valid Python."""
+        target = next(iter(condense.CONDENSED_DOCSTRINGS))
+        source = make_source(target)
+
+        new_content, changes = condense.apply_condensed_docstrings(source, dry_run=False)
+
+        assert isinstance(new_content, bytearray)
+        tree = ast.parse(bytes(new_content))
+        docstrings = [ast.get_docstring(node) for node in tree.body if isinstance(node, ast.AsyncFunctionDef)]
+        assert docstrings[0].startswith(condense.CONDENSED_DOCSTRINGS[target].splitlines()[0])
+        assert docstrings[1:] == [
+            "Leave this docstring alone.",
+            "Similar name, different function.",
+            "A later redefinition; only the first definition is condensed.",
+        ]
+
+        # Everything outside the replaced span is byte-for-byte unchanged
+        start = source.index(b'"""\n    A long-winded')
+        end = source.index(b'"""', start + 3) + 3
+        condensed = condense._CONDENSED_BYTES[target.encode()]
+        assert bytes(new_content) == source[:start] + condensed + source[end:]
+
+        assert changes[0].startswith(f"{target}: ")
+        assert "saved" in changes[0]
+        assert all(change.endswith("NOT FOUND") for change in changes[1:])
+
+    def test_apply_is_idempotent(self, condense):
+        """A second pass leaves the condensed output unchanged."""
+        target = next(iter(condense.CONDENSED_DOCSTRINGS))
+        once, _ = condense.apply_condensed_docstrings(make_source(target), dry_run=False)
+        twice, _ = condense.apply_condensed_docstrings(bytes(once), dry_run=False)
+
+        assert twice == once
+
+    def test_dry_run_returns_input(self, condense):
+        """A dry run reports changes without building new content."""
+        target = next(iter(condense.CONDENSED_DOCSTRINGS))
+        source = make_source(target)
+
+        new_content, changes = condense.apply_condensed_docstrings(source, dry_run=True)
+
+        assert new_content is source
+        assert "saved" in changes[0]
+
+    def test_mmap_input_matches_bytes(self, condense, tmp_path):
+        """A read-only mmap of the file gives the same result as its bytes."""
+        target = next(iter(condense.CONDENSED_DOCSTRINGS))
+        source = make_source(target)
+        path = tmp_path / "server.py"
+        path.write_bytes(source)
+
+        expected = condense.apply_condensed_docstrings(source, dry_run=False)
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            result = condense.apply_condensed_docstrings(content, dry_run=False)
+
+        assert result == expected
+
+    def test_missing_function_is_reported(self, condense):
+        """Content without any target yields NOT FOUND for every entry."""
+        new_content, changes = condense.apply_condensed_docstrings(b"x = 1\n", dry_run=False)
+
+        assert bytes(new_content) == b"x = 1\n"
+        assert len(changes) == len(condense.CONDENSED_DOCSTRINGS)
+        assert all(change.endswith("NOT FOUND") for change in changes)
+
+    def test_server_module_round_trip(self, condense):
+        """Condensing the real server.py source still parses, and a second pass is a no-op."""
+        server_path = SCRIPT_PATH.parent.parent / "daem0nmcp" / "server.py"
+        source = server_path.read_bytes()
+
+        once, _ = condense.apply_condensed_docstrings(source, dry_run=False)
+        ast.parse(bytes(once))
+        twice, _ = condense.apply_condensed_docstrings(bytes(once), dry_run=False)
+
+        assert twice == once
@@ -1,39 +1,46 @@
 """Tests for git integration."""
 
 import pytest
+import shutil
 import tempfile
 import subprocess
 from pathlib import Path
 
 
+@pytest.fixture(scope="session")
+def git_repo_template():
+    """Build a git repository with one commit, once per session."""
+    temp_dir = tempfile.mkdtemp()
+    subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True, check=True)
+
+    # Create initial commit; identity is passed with -c rather than spawning
+    # separate git config processes
+    Path(temp_dir, "README.md").write_text("# Test")
+    subprocess.run(["git", "add", "."], cwd=temp_dir, capture_output=True, check=True)
+    subprocess.run(
+        ["git", "-c", "user.email=test@test.com", "-c", "user.name=Test",
+         "commit", "-m", "Initial commit"],
+        cwd=temp_dir, capture_output=True, check=True
+    )
+
+    yield temp_dir
+
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 class TestGitContext:
     """Test git-related functionality."""
 
     @pytest.fixture
-    def git_repo(self):
-        """Create a temporary git repository."""
+    def git_repo(self, git_repo_template):
+        """Create a temporary git repository by copying the session template."""
         temp_dir = tempfile.mkdtemp()
-        subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=temp_dir, capture_output=True
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=temp_dir, capture_output=True
-        )
-
-        # Create initial commit
-        Path(temp_dir, "README.md").write_text("# Test")
-        subprocess.run(["git", "add", "."], cwd=temp_dir, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit"],
-            cwd=temp_dir, capture_output=True
-        )
-
-        yield temp_dir
-
-        import shutil
+        repo_dir = str(Path(temp_dir, "repo"))
+        # One tree copy instead of five git process spawns per test
+        shutil.copytree(git_repo_template, repo_dir)
+
+        yield repo_dir
+
         shutil.rmtree(temp_dir, ignore_errors=True)
 
     def test_get_git_changes_with_project_path(self, git_repo):
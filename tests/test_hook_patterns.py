@@ -0,0 +1,128 @@
+"""Tests for the shared hook signal patterns (hooks/_patterns.py)."""
+
+import importlib
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+HOOKS_DIR = Path(__file__).resolve().parent.parent / "hooks"
+
+# Sentences that hit each pattern, near misses, and unrelated text
+CORPUS = [
+    "All tasks are complete.",
+    "all todos done",
+    "ALL ITEMS FINISHED!",
+    "I have completed all tasks in the list.",
+    "Complete all items",
+    "Marking the login bug as completed",
+    "marking as complete",
+    "The task is done.",
+    "task finished",
+    "Implementation is complete",
+    "implementation done, moving on",
+    "Successfully implemented the parser.",
+    "successfully finished",
+    "The work is done.",
+    "Changes have been committed and pushed.",
+    "change pushed",
+    "Pull request created: #42",
+    "pull request opened",
+    "The feature is ready for review.",
+    "Bug fix is deployed",
+    "bug complete",
+    "I called mcp__daem0nmcp__record_outcome for memory 3",
+    "record_outcome(memory_id=1)",
+    "I recorded the outcome.",
+    "Outcome has been recorded",
+    "outcome recorded",
+    "Here's the information you asked for.",
+    "Here is an explanation of the flow.",
+    "I found three call sites.",
+    "Let me explain how it works.",
+    "The code does the following.",
+    "The function works by caching results.",
+    "Based on my analysis, the bug is in the parser.",
+    "Based on my exploration",
+    "",
+    "Nothing to see here.",
+    "Still working on the remaining tasks.",
+    "The outcome is unknown.",
+    "completion percentage is 50",
+    "undone tasks remain",
+    "taskmaster is complete",
+    "I refound the file",
+    "functionality looks fine",
+    "the codebase is large",
+    "We will implement this later.",
+    "outcomes will be recorded tomorrow",
+]
+
+GROUPS = [
+    ("COMPLETION_PATTERNS", "COMPLETION_PREFILTER", "COMPLETION_RE"),
+    ("DAEM0N_OUTCOME_PATTERNS", "OUTCOME_PREFILTER", "OUTCOME_RE"),
+    ("EXPLORATION_PATTERNS", "EXPLORATION_PREFILTER", "EXPLORATION_RE"),
+]
+
+# Optional backends to enable: (re2, ahocorasick)
+BACKENDS = {
+    "stdlib": (False, False),
+    "re2": (True, False),
+    "ahocorasick": (False, True),
+    "re2+ahocorasick": (True, True),
+}
+
+
+def import_patterns(monkeypatch, use_re2: bool, use_aho: bool):
+    """Import hooks/_patterns fresh with the optional backends on or off."""
+    for module_name, wanted in (("re2", use_re2), ("ahocorasick", use_aho)):
+        if wanted:
+            pytest.importorskip(module_name)
+        else:
+            # A None entry makes the import raise ImportError
+            monkeypatch.setitem(sys.modules, module_name, None)
+
+    monkeypatch.syspath_prepend(str(HOOKS_DIR))
+    monkeypatch.delitem(sys.modules, "_patterns", raising=False)
+    module = importlib.import_module("_patterns")
+    monkeypatch.delitem(sys.modules, "_patterns")
+
+    assert (module._signal_re is not re) == use_re2
+    assert (module.ahocorasick is not None) == use_aho
+    return module
+
+
+def per_pattern_search(pattern_list, text) -> bool:
+    """The original matcher: one re.search per pattern."""
+    return any(re.search(pattern, text, re.IGNORECASE) for pattern in pattern_list)
+
+
+class TestSignalPatterns:
+    """Test that prefilter + combined alternation match the per-pattern loop."""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    @pytest.mark.parametrize("group", GROUPS, ids=[g[0] for g in GROUPS])
+    def test_combined_matches_per_pattern(self, monkeypatch, backend, group):
+        """Every corpus line gets the same verdict both ways, in any case."""
+        patterns = import_patterns(monkeypatch, *BACKENDS[backend])
+        list_name, prefilter_name, regex_name = group
+        pattern_list = getattr(patterns, list_name)
+        prefilter = getattr(patterns, prefilter_name)
+        regex = getattr(patterns, regex_name)
+
+        mismatches = []
+        for text in CORPUS:
+            for variant in (text, text.upper(), text.title()):
+                expected = per_pattern_search(pattern_list, variant)
+                combined = prefilter(variant.lower()) and regex.search(variant) is not None
+                if combined != expected:
+                    mismatches.append(variant)
+        assert mismatches == []
+
+    @pytest.mark.parametrize("group", GROUPS, ids=[g[0] for g in GROUPS])
+    def test_corpus_covers_every_pattern(self, monkeypatch, group):
+        """Each pattern is exercised by at least one corpus line."""
+        pattern_list = getattr(import_patterns(monkeypatch, False, False), group[0])
+        for pattern in pattern_list:
+            assert any(re.search(pattern, text, re.IGNORECASE) for text in CORPUS), pattern
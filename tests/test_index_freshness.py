@@ -37,15 +37,14 @@ class TestIndexFreshness:
             result1 = await manager.recall("PostgreSQL")
             assert result1["found"] >= 1
 
-            # Simulate external modification (another process added a memory)
-            # Need to wait long enough to ensure timestamp is different (SQLite datetime has second precision)
-            time.sleep(1.1)  # Sleep more than 1 second to ensure different timestamp
-
+            # Simulate external modification (another process added a memory).
+            # SQLite datetime has second precision, so stamp the row ahead of
+            # the index build time instead of sleeping past the next second
             conn = sqlite3.connect(str(db.db_path))
             conn.execute("""
                 INSERT INTO memories (category, content, keywords, tags, context, created_at, updated_at)
                 VALUES ('decision', 'Use Redis for caching', 'redis caching', '["cache"]', '{}',
-                        datetime('now'), datetime('now'))
+                        datetime('now', '+2 seconds'), datetime('now', '+2 seconds'))
             """)
             conn.commit()
             conn.close()
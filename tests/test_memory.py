@@ -48,9 +48,9 @@ def temp_storage():
 
 
 @pytest.fixture
-async def memory_manager(temp_storage):
-    """Create a memory manager with temporary storage."""
-    db = DatabaseManager(temp_storage)
+async def memory_manager(migrated_storage):
+    """Create a memory manager on a copy of the migrated database."""
+    db = DatabaseManager(migrated_storage)
     await db.init_db()
     manager = MemoryManager(db)
     yield manager
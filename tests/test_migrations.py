@@ -128,3 +128,13 @@ class TestMigrations:
 
         assert len(versions) == count
         assert versions == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
+
+    def test_check_column_exists(self, legacy_db):
+        """Verify column introspection binds the table name safely."""
+        from daem0nmcp.migrations.schema import check_column_exists
+
+        with sqlite3.connect(legacy_db) as conn:
+            assert check_column_exists(conn, "memories", "content")
+            assert not check_column_exists(conn, "memories", "pinned")
+            assert not check_column_exists(conn, "memories; DROP TABLE memories", "content")
+            assert check_column_exists(conn, "memories", "content")
@@ -1,6 +1,7 @@
 """Tests for Iteration 4: Performance & UX."""
 
 import pytest
+from collections import deque
 from pathlib import Path
 
 
@@ -19,11 +20,11 @@ class TestParseTreeCache:
         py_file.write_text("def hello(): pass")
 
         # First parse - miss
-        list(indexer.index_file(py_file, tmp_path))
+        deque(indexer.index_file(py_file, tmp_path), maxlen=0)
         assert indexer.cache_stats["misses"] >= 1
 
         # Second parse - hit
-        list(indexer.index_file(py_file, tmp_path))
+        deque(indexer.index_file(py_file, tmp_path), maxlen=0)
         assert indexer.cache_stats["hits"] >= 1
 
     def test_cache_invalidation_on_change(self, tmp_path):
@@ -36,10 +37,10 @@ class TestParseTreeCache:
 
         py_file = tmp_path / "sample.py"
         py_file.write_text("def hello(): pass")
-        list(indexer.index_file(py_file, tmp_path))
+        deque(indexer.index_file(py_file, tmp_path), maxlen=0)
 
         py_file.write_text("def goodbye(): pass")
-        list(indexer.index_file(py_file, tmp_path))
+        deque(indexer.index_file(py_file, tmp_path), maxlen=0)
 
         # Both should be misses (content changed)
         assert indexer.cache_stats["misses"] >= 2
@@ -181,3 +181,96 @@ class TestMCPResources:
         # Should have at most 10 warnings (to keep context efficient)
         warning_count = result.count("Warning number")
         assert warning_count <= 10
+
+
+class TestHookEndpoints:
+    """Test the plain HTTP endpoints used by the pre-edit hook."""
+
+    @pytest.mark.asyncio
+    async def test_hook_check_returns_cli_payload(self, tmp_path):
+        """/check should return the same shape as `cli check --json`."""
+        from daem0nmcp import server
+
+        project_path = str(tmp_path)
+        server._project_contexts.clear()
+        ctx = await server.get_project_context(project_path)
+        try:
+            await ctx.memory_manager.remember(
+                category="warning",
+                content="Never hand-edit generated migrations",
+                file_path="db/migrations.py",
+                project_path=project_path,
+            )
+
+            result = await server._hook_check_impl("db/migrations.py", project_path)
+
+            assert {"file", "warnings", "blockers", "must_do", "must_not"} <= set(result)
+            assert any(w["type"] == "WARNING" for w in result["warnings"])
+        finally:
+            if ctx.memory_manager._qdrant:
+                ctx.memory_manager._qdrant.close()
+            await server.cleanup_all_contexts()
+
+    def test_hook_endpoint_rejects_missing_file(self):
+        """Hook endpoints should reject bodies without a file."""
+        from starlette.applications import Starlette
+        from starlette.routing import Route
+        from starlette.testclient import TestClient
+        from daem0nmcp import server
+
+        app = Starlette(routes=[
+            Route("/check", server.hook_check_endpoint, methods=["POST"]),
+            Route("/check-triggers", server.hook_check_triggers_endpoint, methods=["POST"]),
+            Route("/check-all", server.hook_check_all_endpoint, methods=["POST"]),
+        ])
+        client = TestClient(app)
+
+        for endpoint in ("/check", "/check-triggers", "/check-all"):
+            response = client.post(endpoint, json={"project_path": "/tmp/project"})
+            assert response.status_code == 400
+            assert response.json()["error"] == "MISSING_FILE"
+
+        response = client.post("/check", content=b"not json")
+        assert response.status_code == 400
+
+    def test_hook_endpoint_reports_failures_as_json(self, monkeypatch):
+        """A failing check should come back as a JSON error, not a bare 500."""
+        from starlette.applications import Starlette
+        from starlette.routing import Route
+        from starlette.testclient import TestClient
+        from daem0nmcp import server
+
+        async def broken_context(project_path):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(server, "get_project_context", broken_context)
+        app = Starlette(routes=[
+            Route("/check", server.hook_check_endpoint, methods=["POST"]),
+            Route("/check-triggers", server.hook_check_triggers_endpoint, methods=["POST"]),
+            Route("/check-all", server.hook_check_all_endpoint, methods=["POST"]),
+        ])
+        client = TestClient(app, raise_server_exceptions=False)
+
+        for endpoint in ("/check", "/check-triggers", "/check-all"):
+            response = client.post(endpoint, json={"file": "a.py", "project_path": "/tmp/project"})
+            assert response.status_code == 500
+            assert response.json() == {"error": "CHECK_FAILED", "message": "database is locked"}
+
+    @pytest.mark.asyncio
+    async def test_hook_endpoints_share_cli_helpers(self, tmp_path):
+        """The HTTP trigger and check-all payloads match the CLI helpers."""
+        from daem0nmcp import cli, server
+
+        project_path = str(tmp_path)
+        server._project_contexts.clear()
+        ctx = await server.get_project_context(project_path)
+        try:
+            expected = await cli.check_triggers("src/app.py", ctx.db_manager, project_path=ctx.project_path)
+            assert await server._hook_check_triggers_impl("src/app.py", project_path) == expected
+            combined = await server._hook_check_all_impl("src/app.py", project_path)
+            assert set(combined) == {"memories", "triggers"}
+            assert combined["triggers"] == expected
+        finally:
+            if ctx.memory_manager._qdrant:
+                ctx.memory_manager._qdrant.close()
+            await server.cleanup_all_contexts()
@@ -1,25 +1,15 @@
 """Tests for the rules engine with TF-IDF matching."""
 
 import pytest
-import tempfile
-import shutil
 
 from daem0nmcp.database import DatabaseManager
 from daem0nmcp.rules import RulesEngine
 
 
 @pytest.fixture
-def temp_storage():
-    """Create a temporary storage directory."""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    shutil.rmtree(temp_dir)
-
-
-@pytest.fixture
-async def rules_engine(temp_storage):
-    """Create a rules engine with temporary storage."""
-    db = DatabaseManager(temp_storage)
+async def rules_engine(migrated_storage):
+    """Create a rules engine on a copy of the migrated database."""
+    db = DatabaseManager(migrated_storage)
     await db.init_db()
     engine = RulesEngine(db)
     yield engine
@@ -0,0 +1,190 @@
+"""Tests for the Daem0n stop hook (hooks/daem0n_stop_hook.py)."""
+
+import importlib
+import json
+from pathlib import Path
+
+import pytest
+
+HOOKS_DIR = Path(__file__).resolve().parent.parent / "hooks"
+
+COMPLETION = {"role": "assistant", "content": [{"type": "text", "text": "All tasks are complete."}]}
+OUTCOME = {
+    "role": "assistant",
+    "content": [{"type": "tool_use", "name": "mcp__daem0nmcp__record_outcome", "input": {}}],
+}
+
+
+@pytest.fixture
+def stop_hook(tmp_path, monkeypatch):
+    """Import the stop hook with its transcript and state redirected into tmp_path."""
+    monkeypatch.syspath_prepend(str(HOOKS_DIR))
+    module = importlib.import_module("daem0n_stop_hook")
+    state_dir = tmp_path / "state"
+    monkeypatch.setattr(module, "STATE_DIR", state_dir)
+    monkeypatch.setattr(module, "STATE_FILE", state_dir / "stop_hook_test.state")
+    monkeypatch.setattr(module, "TRANSCRIPT_PATH", str(tmp_path / "transcript.jsonl"))
+    monkeypatch.setattr(module, "PROJECT_DIR", str(tmp_path))
+    return module
+
+
+def write_transcript(hook, messages):
+    Path(hook.TRANSCRIPT_PATH).write_text("".join(json.dumps(m) + "\n" for m in messages))
+
+
+def run_main(hook, capsys) -> str:
+    """Run the hook's main() and return what it printed."""
+    with pytest.raises(SystemExit):
+        hook.main()
+    return capsys.readouterr().out
+
+
+class TestReminderBudget:
+    """Test the per-session reminder cap."""
+
+    def test_outcome_resets_exhausted_budget(self, stop_hook, capsys):
+        """Recording an outcome after the cap is hit should re-arm reminders."""
+        write_transcript(stop_hook, [COMPLETION])
+
+        for _ in range(stop_hook.MAX_REMINDERS):
+            assert "record the outcome" in run_main(stop_hook, capsys)
+        assert stop_hook.STATE_FILE.read_text() == f"{stop_hook.MAX_REMINDERS} 1"
+
+        # Exhausted: further completions stay silent
+        assert run_main(stop_hook, capsys) == ""
+        assert stop_hook.load_state()["exhausted"] == 1
+
+        # An outcome clears the state even while exhausted
+        write_transcript(stop_hook, [COMPLETION, OUTCOME])
+        assert run_main(stop_hook, capsys) == ""
+        assert not stop_hook.STATE_FILE.exists()
+
+        # The next completed task gets a reminder again
+        write_transcript(stop_hook, [COMPLETION])
+        assert "record the outcome" in run_main(stop_hook, capsys)
+        assert stop_hook.load_state() == {"reminder_count": 1, "exhausted": 0}
+
+    def test_exhausted_skips_transcript_parse(self, stop_hook, capsys, monkeypatch):
+        """While exhausted, only the raw tail is scanned; messages are never parsed."""
+        write_transcript(stop_hook, [COMPLETION])
+        stop_hook.save_state({"reminder_count": stop_hook.MAX_REMINDERS, "exhausted": 1})
+
+        def fail(*args):
+            raise AssertionError("transcript parsed while exhausted")
+
+        monkeypatch.setattr(stop_hook, "read_transcript", fail)
+        monkeypatch.setattr(stop_hook, "json_loads", fail)
+
+        assert run_main(stop_hook, capsys) == ""
+        assert stop_hook.load_state()["exhausted"] == 1
+
+        write_transcript(stop_hook, [COMPLETION, OUTCOME])
+        assert run_main(stop_hook, capsys) == ""
+        assert not stop_hook.STATE_FILE.exists()
+
+
+def reference_tail(data: bytes, max_lines: int) -> list[bytes]:
+    """The last max_lines non-empty lines, from a plain full read."""
+    return [line for line in data.splitlines() if line.strip()][-max_lines:]
+
+
+def forward_read(path: str) -> list[dict]:
+    """The hook's original transcript reader: parse every non-empty line."""
+    messages = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                try:
+                    messages.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    return messages
+
+
+class TestTailLines:
+    """Test backwards reading of the transcript tail."""
+
+    def test_file_smaller_than_block(self, stop_hook, tmp_path):
+        """A file that fits in one block returns its last lines."""
+        path = tmp_path / "small.txt"
+        path.write_bytes(b"one\ntwo\nthree\n")
+
+        assert stop_hook._tail_lines(str(path), max_lines=2) == [b"two", b"three"]
+        assert stop_hook._tail_lines(str(path), max_lines=10) == [b"one", b"two", b"three"]
+
+    def test_empty_file(self, stop_hook, tmp_path):
+        """An empty file has no lines."""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+
+        assert stop_hook._tail_lines(str(path)) == []
+
+    @pytest.mark.parametrize("block", [1, 3, 7, 16, 64])
+    def test_line_straddling_block_boundary(self, stop_hook, tmp_path, block):
+        """Lines split across block reads come back whole."""
+        data = b"".join(b"line-%d-" % i + b"x" * (i * 5) + b"\n" for i in range(12))
+        path = tmp_path / "straddle.txt"
+        path.write_bytes(data)
+
+        for max_lines in (1, 4, 11, 12, 20):
+            assert stop_hook._tail_lines(str(path), max_lines, block) == reference_tail(data, max_lines)
+
+    @pytest.mark.parametrize("block", [1, 4, 64])
+    @pytest.mark.parametrize("data", [
+        b"a\nb\nc",
+        b"a\nb\nc\n",
+        b"a\nb\n\n\n\n",
+        b"\n\na\n\n\nb\n  \n\n",
+        b"a\nb\n" + b"\n" * 50,
+    ])
+    def test_trailing_newline_and_blank_lines(self, stop_hook, tmp_path, block, data):
+        """Blank lines are skipped and never crowd out real ones."""
+        path = tmp_path / "blank.txt"
+        path.write_bytes(data)
+
+        for max_lines in (1, 2, 3):
+            assert stop_hook._tail_lines(str(path), max_lines, block) == reference_tail(data, max_lines)
+
+    @pytest.mark.parametrize("block", [1, 2, 5, 64])
+    def test_crlf_line_endings(self, stop_hook, tmp_path, block):
+        """CRLF endings are stripped, including when a block splits \\r from \\n."""
+        data = b"first\r\nsecond\r\n\r\nthird\r\n"
+        path = tmp_path / "crlf.txt"
+        path.write_bytes(data)
+
+        assert stop_hook._tail_lines(str(path), 2, block) == [b"second", b"third"]
+        assert stop_hook._tail_lines(str(path), 5, block) == [b"first", b"second", b"third"]
+
+
+class TestReadTranscript:
+    """Test that the tail read keeps the forward read's lookback windows."""
+
+    def test_recent_windows_match_forward_read(self, stop_hook):
+        """Placeholders for skipped lines keep the "recent N" windows aligned."""
+        messages = []
+        for i in range(15):
+            messages.append({"role": "user", "content": f"request {i}"})
+            messages.append({"role": "user", "content": [{"type": "tool_result", "content": "x" * 500}]})
+            messages.append({"role": "assistant", "content": [
+                {"type": "text", "text": f"step {i} done"},
+                {"type": "tool_use", "name": f"Tool{i}", "input": {}},
+            ]})
+        lines = [json.dumps(m) for m in messages]
+        # Blank lines and CRLF endings are not messages in either reader
+        lines[-4] += "\r\n"
+        Path(stop_hook.TRANSCRIPT_PATH).write_text("\n".join(lines) + "\n\n", newline="")
+
+        old = forward_read(stop_hook.TRANSCRIPT_PATH)
+        new = stop_hook.read_transcript()
+
+        assert len(new) == stop_hook.TRANSCRIPT_TAIL_LINES
+        for lookback in (1, 2, 3, 5, 10, stop_hook.TRANSCRIPT_TAIL_LINES):
+            assert (stop_hook.get_recent_assistant_content(new, lookback)
+                    == stop_hook.get_recent_assistant_content(old, lookback))
+            assert (stop_hook.get_recent_tool_calls(new, lookback)
+                    == stop_hook.get_recent_tool_calls(old, lookback))
+        # Skipped lines occupy the same slots as their parsed originals
+        assert [m.get("role") == "assistant" for m in new] == [
+            m.get("role") == "assistant" for m in old[-len(new):]
+        ]
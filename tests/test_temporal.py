@@ -17,12 +17,12 @@ def temp_storage():
 
 
 @pytest.fixture
-async def memory_manager(temp_storage):
-    """Create a memory manager with temporary storage."""
+async def memory_manager(migrated_storage):
+    """Create a memory manager on a copy of the migrated database."""
     from daem0nmcp.database import DatabaseManager
     from daem0nmcp.memory import MemoryManager
 
-    db = DatabaseManager(temp_storage)
+    db = DatabaseManager(migrated_storage)
     await db.init_db()
     manager = MemoryManager(db)
     yield manager